@@ -4,12 +4,22 @@
 from __future__ import annotations
 
 import posixpath
+import sys
 from dataclasses import dataclass
 from fnmatch import fnmatch
-from typing import Generator
+from typing import (
+    Any,
+    Generator,
+)
 
+# instances are kept long-term, in large numbers. Use slots to keep them
+# small, where supported by dataclasses (Python 3.10+)
+_DATACLASS_KWARGS: dict[str, Any] = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS['slots'] = True
 
-@dataclass(frozen=True)
+
+@dataclass(**_DATACLASS_KWARGS)
 class GitPathSpec:
     """Support class for patterns used to limit paths in Git commands
 
@@ -66,6 +76,23 @@ class GitPathSpec:
         """Whether this pathspec is the "no pathspecs" pathspec, AKA ``':'``"""
         return not self.spectypes and not self.dirprefix and not self.pattern
 
+    @property
+    def is_universal_match(self) -> bool:
+        """Whether this pathspec translates into the scope of any subdirectory
+
+        This is the case for the "no pathspecs" pathspec, any pathspec with
+        the ``top`` magic, and patterns that start with a wildcard that
+        also matches directories (``*``, or ``**`` with ``glob`` magic).
+        For such pathspecs ``for_subdir()`` never returns an empty list.
+        """
+        if self.is_nopathspecs or 'top' in self.spectypes:
+            return True
+        if 'literal' in self.spectypes:
+            return False
+        return self.get_joined_pattern().startswith(
+            '**' if 'glob' in self.spectypes else '*'
+        )
+
     def __str__(self) -> str:
         """Generate normalized (long-form) pathspec"""
         if self.is_nopathspecs:
@@ -155,24 +182,36 @@ class GitPathSpec:
         dirprefix, pattern = _split_prefix_pattern(pattern)
 
         return cls(
-            spectypes=tuple(spectypes),
+            spectypes=_intern_spectypes(tuple(spectypes)),
             dirprefix=dirprefix,
             pattern=pattern,
         )
 
 
+# mapping of short-form magic signatures to their long-form names
+_SHORTFORM_MAGIC = {
+    '/': 'top',
+    '!': 'exclude',
+    '^': 'exclude',
+    ':': None,
+}
+
+
+# registry of spectypes, to share them across all pathspecs with the same
+# magic
+_SPECTYPES: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _intern_spectypes(spectypes: tuple[str, ...]) -> tuple[str, ...]:
+    return _SPECTYPES.setdefault(spectypes, spectypes)
+
+
 def _pathspec_from_shortform(spec: str) -> tuple[list[str], str]:
     # short-form magic
-    magic_signatures = {
-        '/': 'top',
-        '!': 'exclude',
-        '^': 'exclude',
-        ':': None,
-    }
     pattern = spec[1:]
     spectypes: list[str] = []
     for i in range(1, len(spec)):
-        sig = magic_signatures.get(spec[i])
+        sig = _SHORTFORM_MAGIC.get(spec[i])
         if sig is None:
             return (spectypes, spec[i:])
         spectypes.append(sig)
@@ -182,17 +221,11 @@ def _pathspec_from_shortform(spec: str) -> tuple[list[str], str]:
 def _split_prefix_pattern(pathspec: str) -> tuple[str | None, str | None]:
     # > the pathspec up to the last slash represents a directory prefix.
     # > The scope of that pathspec is limited to that subtree.
-    pattern: str | None = None
-    try:
-        last_slash_idx = pathspec[::-1].index('/')
-    except ValueError:
+    dirprefix, slash, pattern = pathspec.rpartition('/')
+    if not slash:
         # everything is the pattern
-        dirprefix = None
-        pattern = pathspec
-    else:
-        dirprefix = pathspec[: -last_slash_idx - 1]
-        pattern = pathspec[-last_slash_idx:] if last_slash_idx > 0 else None
-    return dirprefix, pattern
+        return None, pathspec
+    return dirprefix, pattern or None
 
 
 def yield_subdir_match_remainder_pathspecs(
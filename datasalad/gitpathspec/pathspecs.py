@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from itertools import chain
 from typing import TYPE_CHECKING
 
 from datasalad.gitpathspec.pathspec import GitPathSpec
@@ -43,27 +42,43 @@ class GitPathSpecs:
         equivalent to a single ``':'`` pathspec.
         """
         self._pathspecs: tuple[GitPathSpec, ...] | None = None
+        # cache for subdirectory translations, keyed by the subdirectory
+        # path. The container is immutable, hence cache entries never
+        # go stale
+        self._subdir_cache: dict[str, GitPathSpecs | None] = {}
+        # string-form pathspecs, built on first request
+        self._args: tuple[str, ...] | None = None
 
         if pathspecs is None:
             self._pathspecs = None
-            return
-
-        if isinstance(pathspecs, GitPathSpecs):
+        elif isinstance(pathspecs, GitPathSpecs):
             self._pathspecs = pathspecs.pathspecs or None
-            return
-
-        # we got something that needs converting
-        self._pathspecs = tuple(
-            ps if isinstance(ps, GitPathSpec) else GitPathSpec.from_pathspec_str(ps)
-            for ps in pathspecs
-        )
-        if not self._pathspecs:
-            msg = (
-                f'{pathspecs!r} did not contain any pathspecs. '
-                'To indicate "no pathspec constraints" use the '
-                '":" pathspec or `None`.'
+        else:
+            # we got something that needs converting.
+            # the exact type test is a cheap shortcut for the common case,
+            # subclasses are still recognized
+            gps = GitPathSpec
+            from_str = gps.from_pathspec_str
+            self._pathspecs = tuple(
+                ps if type(ps) is gps or isinstance(ps, gps) else from_str(ps)
+                for ps in pathspecs
             )
-            raise ValueError(msg)
+            if not self._pathspecs:
+                msg = (
+                    f'{pathspecs!r} did not contain any pathspecs. '
+                    'To indicate "no pathspec constraints" use the '
+                    '":" pathspec or `None`.'
+                )
+                raise ValueError(msg)
+        # whether any subdirectory is matched, regardless of its path.
+        # Determined on first match test, see `any_match_subdir()`
+        self._always_match: bool | None = None
+        # whether translation into any subdirectory yields the very same
+        # pathspecs. This is the case for "no pathspecs" (`None` or ':'),
+        # and for pathspecs with the 'top' magic
+        self._subdir_invariant = self._pathspecs is None or all(
+            ps.is_nopathspecs or 'top' in ps.spectypes for ps in self._pathspecs
+        )
 
     def __repr__(self) -> str:
         return (
@@ -74,13 +89,15 @@ class GitPathSpecs:
         return len(self._pathspecs) if self._pathspecs is not None else 0
 
     def __eq__(self, obj):
-        return self.pathspecs == obj.pathspecs
+        if self is obj:
+            return True
+        if not isinstance(obj, GitPathSpecs):
+            return NotImplemented
+        return self._pathspecs == obj.pathspecs
+
+    def __hash__(self):
+        return hash(self._pathspecs)
 
-    # TODO: lru_cache decorator?
-    # this would prevent repeated conversion cost for the usage pattern of
-    # - test if we would have a match for a subdir
-    # - run code with the matching pathspecs
-    # without having to implement caching logic in client code
     def for_subdir(
         self,
         path: PurePosixPath,
@@ -93,12 +110,8 @@ class GitPathSpecs:
           Whenever no pathspec can be translated into the scope of the target
           directory.
         """
-        if not self._pathspecs:
-            return GitPathSpecs(None)
-        translated = list(
-            chain.from_iterable(ps.for_subdir(str(path)) for ps in self._pathspecs)
-        )
-        if not translated:
+        translated = self.translate_for_subdir(path)[0]
+        if translated is None:
             # not a single pathspec could be translated into the subdirectory
             # scope. This means none was applicable, and not that the whole
             # subdirectory is matched. We raise in order to allow client code
@@ -107,7 +120,7 @@ class GitPathSpecs:
             # rather than "no match"
             msg = f'No pathspecs translate to {path=}'
             raise ValueError(msg)
-        return GitPathSpecs(translated)
+        return translated
 
     def any_match_subdir(
         self,
@@ -123,10 +136,72 @@ class GitPathSpecs:
         path: PurePosixPath
           Relative path of the subdirectory to run the test for.
         """
-        if self._pathspecs is None:
+        always_match = self._always_match
+        if always_match is None:
+            # the container is immutable, test only once. Not already at
+            # construction, many containers never get a match test
+            always_match = self._always_match = self._pathspecs is None or any(
+                ps.is_universal_match for ps in self._pathspecs
+            )
+        if always_match:
+            # avoid translations when only a match test is needed
             return True
-        path_s = str(path)
-        return any(ps.for_subdir(path_s) for ps in self._pathspecs)
+        return self.translate_for_subdir(path)[1]
+
+    def translate_for_subdir(
+        self,
+        path: PurePosixPath,
+    ) -> tuple[GitPathSpecs | None, bool]:
+        """Translate pathspecs into the scope of a subdirectory, if possible
+
+        This combines ``any_match_subdir()`` and ``for_subdir()`` into a
+        single call, for the common pattern of testing for a match, and
+        subsequently running code with the translated pathspecs.
+
+        Translations are cached. Repeated calls for the same subdirectory,
+        including via ``any_match_subdir()`` and ``for_subdir()``, return
+        the same ``GitPathSpecs`` instance.
+
+        Parameters
+        ----------
+        path: PurePosixPath
+          Relative path of the subdirectory to translate pathspecs for.
+
+        Returns
+        -------
+        tuple
+          The translated pathspecs and ``True``, or ``(None, False)`` when
+          no pathspec can be translated into the scope of the subdirectory.
+        """
+        if self._subdir_invariant:
+            # the container is immutable, no need to copy
+            return self, True
+        translated = self._translate(str(path))
+        return translated, translated is not None
+
+    def _translate(self, path_s: str) -> GitPathSpecs | None:
+        """Return (cached) translations of all pathspecs for a subdirectory
+
+        ``None`` is returned when no pathspec translates into the
+        subdirectory scope.
+        """
+        if TYPE_CHECKING:
+            assert self._pathspecs is not None
+        subdir = _normalize_subdir(path_s)
+        if not subdir:
+            # the root directory itself, no translation
+            return self
+        try:
+            return self._subdir_cache[subdir]
+        except KeyError:
+            pass
+        translations: list[GitPathSpec] = []
+        extend = translations.extend
+        for ps in self._pathspecs:
+            extend(ps.for_subdir(subdir))
+        translated = GitPathSpecs(translations) if translations else None
+        self._subdir_cache[subdir] = translated
+        return translated
 
     def arglist(self) -> list[str]:
         """Convert pathspecs to a CLI argument list
@@ -139,8 +214,25 @@ class GitPathSpecs:
         """
         if self._pathspecs is None:
             return []
-        return [str(ps) for ps in self._pathspecs]
+        args = self._args
+        if args is None:
+            args = self._args = tuple(str(ps) for ps in self._pathspecs)
+        # return a new list, callers may modify it
+        return list(args)
 
     @property
     def pathspecs(self) -> tuple[GitPathSpec, ...] | None:
         return self._pathspecs
+
+
+def _normalize_subdir(path_s: str) -> str:
+    """Normalize a subdirectory path once for all pathspec translations
+
+    The root directory (``''`` or ``'.'``) is reported as an empty string.
+    Any other path gets the trailing slash that pathspec translation
+    requires. This also makes paths with and without a trailing slash share
+    a cache entry.
+    """
+    if path_s in ('', '.', './'):
+        return ''
+    return path_s if path_s.endswith('/') else f'{path_s}/'
@@ -1,6 +1,9 @@
 import subprocess
 import sys
-from pathlib import Path
+from pathlib import (
+    Path,
+    PurePosixPath,
+)
 
 import pytest
 
@@ -417,6 +420,18 @@ def test_yield_subdir_match_remainder_pathspecs():
                 assert GitPathSpecs([tsps]).any_match_subdir(target_path)
             else:
                 assert not GitPathSpecs([tsps]).any_match_subdir(target_path)
+            # a universal match must translate into any subdir
+            if tsps.is_universal_match:
+                assert remainders
+
+
+def test_GitPathSpec_compact():
+    ps1 = GitPathSpec.from_pathspec_str(':(glob,icase)one/*')
+    ps2 = GitPathSpec.from_pathspec_str(':(glob,icase)two')
+    # identical magic is shared
+    assert ps1.spectypes is ps2.spectypes
+    if sys.version_info >= (3, 10):
+        assert not hasattr(ps1, '__dict__')
 
 
 def test_GitPathSpecs():
@@ -427,8 +442,38 @@ def test_GitPathSpecs():
 
     # going over the properties
     assert repr(ps) == "GitPathSpecs(['mike/*', '*.jpg'])"
+    # modifying the returned argument list has no side-effects
+    ps.arglist().append('--bogus')
+    assert ps.arglist() == spec_input
     assert len(ps) == len(spec_input)
 
+    # comparison and hashing
+    assert ps == GitPathSpecs(spec_input)
+    assert ps != spec_input
+    assert hash(ps) == hash(GitPathSpecs(spec_input))
+    assert {ps: 'some'}[GitPathSpecs(spec_input)] == 'some'
+
+    # subdir translations are reused across a match test and the actual
+    # translation
+    assert ps.any_match_subdir('mike')
+    assert ps.for_subdir('mike') is ps.for_subdir('mike')
+    assert ps.for_subdir('mike').arglist() == [':', '*.jpg']
+    # test and translation in one go
+    assert ps.translate_for_subdir('mike') == (ps.for_subdir('mike'), True)
+    assert GitPathSpecs(['mike/*']).translate_for_subdir('bob') == (None, False)
+    # with and without trailing slash is the same subdir
+    assert ps.for_subdir('mike/') == ps.for_subdir('mike')
+    assert len(ps._subdir_cache) == 1  # noqa: SLF001
+    # the root directory needs no translation
+    assert ps.for_subdir('') == ps
+    assert ps.for_subdir(PurePosixPath('.')) == ps
+    assert not GitPathSpecs(['mike/*']).any_match_subdir('bob')
+    # a leading wildcard matches any subdir, no translation needed
+    assert ps.any_match_subdir('bob')
+    assert ps._always_match  # noqa: SLF001
+    with pytest.raises(ValueError, match='No pathspecs translate'):
+        GitPathSpecs(['mike/*']).for_subdir('bob')
+
     # we can have "no pathspecs". `None` and a single ':' are equivalent
     # ways to communicate this
     for ps in (None, ':'):
@@ -436,6 +481,12 @@ def test_GitPathSpecs():
         assert GitPathSpecs(ps).for_subdir('doesntmatter') == nops
         assert GitPathSpecs(ps).any_match_subdir('doesntmatter') is True
 
+    # no-op translations need no processing, but pathspecs are kept
+    for spec in ([':'], [':(top)mike/*', ':']):
+        ps = GitPathSpecs(spec)
+        assert ps.for_subdir('doesntmatter') is ps
+        assert ps.for_subdir('doesntmatter').arglist() == spec
+
     # how about the semantic distinction between None and []?
     # [] is not valid
     with pytest.raises(ValueError, match='did not contain any pathspecs'):
@@ -19,8 +19,10 @@ and was written by Michal Charemza.
    :toctree: generated
 
    iterable_subprocess
+   iterable_subprocess_async
 """
 
-__all__ = ['iterable_subprocess']
+__all__ = ['iterable_subprocess', 'iterable_subprocess_async']
 
 from .iterable_subprocess import iterable_subprocess
+from .iterable_subprocess_async import iterable_subprocess_async
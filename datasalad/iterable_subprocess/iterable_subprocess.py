@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Generator
-from contextlib import contextmanager
+import os
+import sys
+from contextlib import (
+    contextmanager,
+    suppress,
+)
 from subprocess import PIPE, Popen
 from threading import Thread
 from typing import (
+    IO,
     TYPE_CHECKING,
     Iterable,
 )
@@ -13,28 +17,138 @@ from typing import (
 if TYPE_CHECKING:
     from os import PathLike
 
+if sys.platform.startswith('linux'):
+    import fcntl
+
 from datasalad.runners import CommandError
 
 # Errno22 indicates an IO failure with a
 # file descriptor
 ERRCODE_IO_FAILURE = 22
 
+# Linux pipes hold 64KiB by default, and can be grown via fcntl().
+# The constant is only exposed by the `fcntl` module of Python 3.10+
+LINUX_PIPE_SIZE = 65536
+LINUX_F_SETPIPE_SZ = 1031
+
+
+def _grow_pipe(fileobj, size: int) -> None:
+    """Make a (Linux) pipe hold at least ``size`` bytes, if possible
+
+    A read can only return what the pipe holds. Reading in chunks that are
+    larger than the pipe does not reduce the number of reads, but only
+    allocates larger buffers.
+    """
+    if size <= LINUX_PIPE_SIZE or not sys.platform.startswith('linux'):
+        return
+    # an OSError is raised when the size exceeds the system limit for
+    # unprivileged users, or the user's pipe buffers are exhausted.
+    # Stay with the default then
+    with suppress(OSError):
+        fcntl.fcntl(fileobj.fileno(), LINUX_F_SETPIPE_SZ, size)
+
+
+class _ExceptionReportingThread(Thread):
+    """Thread that keeps any exception raised by its target for reporting"""
+
+    def __init__(self, target, *args):
+        super().__init__(target=target, args=args)
+        self.exception: BaseException | None = None
+
+    def run(self):
+        try:
+            super().run()
+        except BaseException as e:  # noqa: BLE001
+            # ok to catch any exception here, we are reporting them
+            self.exception = e
+
+    def join_exception(self) -> BaseException | None:
+        """Wait for a started thread to finish and return its exception"""
+        if self.ident:
+            self.join()
+        return self.exception
+
+
+class _RingBuffer:
+    """Fixed-size circular buffer that keeps the most recently read bytes
 
-class OutputFrom(Generator):
-    def __init__(self, stdout, stderr_deque, chunk_size=65536):
+    Data is read from a stream directly into the buffer, older data is
+    overwritten once the buffer is full.
+    """
+
+    __slots__ = ('_pos', '_view', '_wrapped')
+
+    def __init__(self, size: int):
+        # the buffer is never resized, a single view can be used throughout
+        self._view = memoryview(bytearray(size))
+        self._pos = 0
+        self._wrapped = False
+
+    def fill_from(self, stream) -> int:
+        """Read from ``stream`` into the buffer, return the number of bytes"""
+        n = stream.readinto(self._view[self._pos :])
+        if not n:
+            return 0
+        self._pos += n
+        if self._pos == len(self._view):
+            self._pos = 0
+            self._wrapped = True
+        return n
+
+    def getvalue(self) -> bytes:
+        """Return the buffer content in the order it was read"""
+        if not self._wrapped:
+            return self._view[: self._pos].tobytes()
+        return b''.join((self._view[self._pos :], self._view[: self._pos]))
+
+    def detach(self) -> bytes:
+        """Return the buffer content and release the buffer memory
+
+        The buffer is empty afterwards, and can no longer be filled.
+        """
+        value = self.getvalue()
+        self._view = memoryview(b'')
+        self._pos = 0
+        self._wrapped = False
+        return value
+
+
+class OutputFrom:
+    __slots__ = ('chunk_size', 'returncode', 'stderr_buf', 'stdout')
+
+    def __init__(self, stdout, stderr_buf, chunk_size=65536):
         self.stdout = stdout
-        self.stderr_deque = stderr_deque
+        self.stderr_buf = stderr_buf
         self.chunk_size = chunk_size
         self.returncode = None
 
-    def send(self, _):
-        chunk = self.stdout.read(self.chunk_size)
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # read from the file descriptor directly. The buffered reader would
+        # only add a copy, and a blocking read until a full chunk arrived.
+        # `fileno()` raises `ValueError` once the stream is closed
+        if self.stdout is None:
+            # output goes elsewhere
+            raise StopIteration
+        chunk = os.read(self.stdout.fileno(), self.chunk_size)
         if not chunk:
             raise StopIteration
         return chunk
 
-    def throw(self, typ, value=None, traceback=None):
-        return super().throw(typ, value, traceback)
+    def readinto(self, buffer) -> int:
+        """Read the next piece of output into a caller-provided buffer
+
+        This is an alternative to iteration for consumers that reuse their
+        own buffers, instead of receiving a new ``bytes`` object for each
+        chunk. At most ``len(buffer)`` bytes are read. Returns the number
+        of bytes read, zero indicates the end of the output.
+        """
+        if self.stdout is None:
+            return 0
+        # bypass any buffered reader, like `__next__()` does
+        return getattr(self.stdout, 'raw', self.stdout).readinto(buffer)
 
 
 @contextmanager
@@ -43,7 +157,8 @@ def iterable_subprocess(
     input_chunks: Iterable[bytes],
     chunk_size: int = 65536,
     cwd: PathLike | str | None = None,
-    bufsize: int = -1,
+    bufsize: int = 65536,
+    stdout: int | IO | None = None,
 ):
     """Subprocess execution context manager with iterable IO
 
@@ -93,6 +208,11 @@ def iterable_subprocess(
     - if it's non-zero raise a ``CommandError`` containing its standard error
     - if it's zero, re-raise the original ``BrokenPipeError``
 
+    If the process's output is only passed on to a file or another pipe,
+    a file descriptor or file object can be given as ``stdout``. The process
+    then writes to it directly, without any copies through this process, and
+    iterating over the ``as``-variable yields nothing.
+
     >>> # regular execution, no input iterable
     >>> with iterable_subprocess(['printf', 'test'], []) as proc:
     ...     for chunk in proc:
@@ -108,35 +228,17 @@ def iterable_subprocess(
     class _BrokenPipeError(Exception):
         pass
 
-    @contextmanager
-    def thread(target, *args):
-        exception = None
-
-        def wrapper():
-            nonlocal exception
-            try:
-                target(*args)
-            except BaseException as e:  # noqa: BLE001
-                # ok to catch any exception here, we are reporting them
-                exception = e
-
-        t = Thread(target=wrapper)
-
-        def start():
-            t.start()
-
-        def join():
-            if t.ident:
-                t.join()
-            return exception
-
-        yield start, join
-
     def input_to(stdin):
+        # small chunks need no coalescing here. With buffering enabled
+        # (`bufsize != 0`) the buffered writer already gathers them into
+        # large writes, and with `bufsize=0` each chunk must reach the
+        # process immediately. `writelines()` is not used, because errors
+        # raised by the input iterable must not be mistaken for pipe errors
+        write = stdin.write
         try:
             for chunk in input_chunks:
                 try:
-                    stdin.write(chunk)
+                    write(chunk)
                 except BrokenPipeError:
                     raise _BrokenPipeError  # noqa B904
                 except OSError as e:
@@ -157,24 +259,16 @@ def iterable_subprocess(
                 if e.errno != ERRCODE_IO_FAILURE:
                     raise
 
-    def keep_only_most_recent(stderr, stderr_deque):
-        total_length = 0
-        while True:
-            chunk = stderr.read(chunk_size)
-            total_length += len(chunk)
-            if not chunk:
-                break
-            stderr_deque.append(chunk)
-            if total_length - len(stderr_deque[0]) >= chunk_size:
-                total_length -= len(stderr_deque[0])
-                stderr_deque.popleft()
+    def keep_only_most_recent(stderr, stderr_buf):
+        while stderr_buf.fill_from(stderr):
+            pass
 
     def raise_if_not_none(exception):
         if exception is not None:
             raise exception from None
 
     proc: Popen | None = None
-    stderr_deque: deque[bytes] = deque()
+    stderr_buf = _RingBuffer(chunk_size)
     chunk_generator = None
     exception_stdin = None
     exception_stderr = None
@@ -183,22 +277,28 @@ def iterable_subprocess(
         with Popen(  # nosec - all arguments are controlled by the caller
             program,
             stdin=PIPE,
-            stdout=PIPE,
+            stdout=PIPE if stdout is None else stdout,
             stderr=PIPE,
             cwd=cwd,
             bufsize=bufsize,
-        ) as proc, thread(
-            keep_only_most_recent,
-            proc.stderr,
-            stderr_deque,
-        ) as (start_t_stderr, join_t_stderr), thread(
-            input_to,
-            proc.stdin,
-        ) as (start_t_stdin, join_t_stdin):
+        ) as proc:
+            if proc.stdout is not None:
+                _grow_pipe(proc.stdout, chunk_size)
+            t_stderr = _ExceptionReportingThread(
+                keep_only_most_recent,
+                proc.stderr,
+                stderr_buf,
+            )
+            t_stdin = _ExceptionReportingThread(input_to, proc.stdin)
             try:
-                start_t_stderr()
-                start_t_stdin()
-                chunk_generator = OutputFrom(proc.stdout, stderr_deque, chunk_size)
+                t_stderr.start()
+                if isinstance(input_chunks, (list, tuple)) and not input_chunks:
+                    # there is no input, stdin only needs to be closed.
+                    # Do it right here, there is no need for a thread
+                    t_stdin.run()
+                else:
+                    t_stdin.start()
+                chunk_generator = OutputFrom(proc.stdout, stderr_buf, chunk_size)
                 yield chunk_generator
             except BaseException:
                 proc.terminate()
@@ -206,10 +306,10 @@ def iterable_subprocess(
             finally:
                 if TYPE_CHECKING:
                     assert proc is not None
-                    assert proc.stdout is not None
-                proc.stdout.close()
-                exception_stdin = join_t_stdin()
-                exception_stderr = join_t_stderr()
+                if proc.stdout is not None:
+                    proc.stdout.close()
+                exception_stdin = t_stdin.join_exception()
+                exception_stderr = t_stderr.join_exception()
 
             raise_if_not_none(exception_stdin)
             raise_if_not_none(exception_stderr)
@@ -237,6 +337,8 @@ def iterable_subprocess(
         raise CommandError(
             cmd=program,
             returncode=proc.returncode,
-            stderr=b''.join(stderr_deque)[-chunk_size:],
+            # the exception can live on for long, together with the frames
+            # in its traceback. Make it hold the stderr tail only once
+            stderr=stderr_buf.detach(),
             cwd=cwd,
         )
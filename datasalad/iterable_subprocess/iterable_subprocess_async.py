@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import (
+    asynccontextmanager,
+    suppress,
+)
+from subprocess import PIPE
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+)
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+from datasalad.runners import CommandError
+
+# pipe file descriptors, as reported to the subprocess protocol
+_STDIN, _STDOUT, _STDERR = 0, 1, 2
+
+
+class _BrokenPipeError(Exception):
+    pass
+
+
+class _SubprocessProtocol(asyncio.SubprocessProtocol):
+    """Collects output of a subprocess, and tracks its state
+
+    Standard output is buffered, up to a limit, until it is consumed via
+    ``read()``. Only the most recent standard error output is kept.
+    """
+
+    def __init__(self, chunk_size: int):
+        loop = asyncio.get_running_loop()
+        self.chunk_size = chunk_size
+        self.transport: asyncio.SubprocessTransport | None = None
+        self.stdout_chunks: deque[bytes] = deque()
+        self.stdout_size = 0
+        self.stdout_closed = False
+        self.stdout_paused = False
+        self.stdout_waiter: asyncio.Future | None = None
+        self.stderr_tail = bytearray()
+        self.stdin_lost = False
+        self.stdin_writable = asyncio.Event()
+        self.stdin_writable.set()
+        # process exit, and the closing of stdout and stderr
+        self._pending = {-1, _STDOUT, _STDERR}
+        self.done = loop.create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def pipe_data_received(self, fd, data):
+        if fd == _STDOUT:
+            self.stdout_chunks.append(data)
+            self.stdout_size += len(data)
+            if self.stdout_size > 2 * self.chunk_size and not self.stdout_paused:
+                # push back on the process, until output is consumed
+                self._stdout_transport().pause_reading()
+                self.stdout_paused = True
+            self._wake_reader()
+        elif fd == _STDERR:
+            self.stderr_tail += data
+            if len(self.stderr_tail) > 2 * self.chunk_size:
+                del self.stderr_tail[: -self.chunk_size]
+
+    def pipe_connection_lost(self, fd, exc):  # noqa: ARG002
+        if fd == _STDIN:
+            self.stdin_lost = True
+            # wake a writer waiting for the pipe to drain
+            self.stdin_writable.set()
+        elif fd == _STDOUT:
+            self.stdout_closed = True
+            self._wake_reader()
+        self._mark_done(fd)
+
+    def process_exited(self):
+        self._mark_done(-1)
+
+    def pause_writing(self):
+        self.stdin_writable.clear()
+
+    def resume_writing(self):
+        self.stdin_writable.set()
+
+    async def read(self) -> bytes:
+        """Return the next chunk of standard output, or ``b''`` at the end"""
+        while not self.stdout_chunks:
+            if self.stdout_closed:
+                return b''
+            self.stdout_waiter = asyncio.get_running_loop().create_future()
+            await self.stdout_waiter
+        chunk = self.stdout_chunks.popleft()
+        if len(chunk) > self.chunk_size:
+            self.stdout_chunks.appendleft(chunk[self.chunk_size :])
+            chunk = chunk[: self.chunk_size]
+        self.stdout_size -= len(chunk)
+        if self.stdout_paused and self.stdout_size <= self.chunk_size:
+            self._stdout_transport().resume_reading()
+            self.stdout_paused = False
+        return chunk
+
+    async def write(self, chunk: bytes) -> None:
+        """Write a chunk to standard input, and wait until it can take more"""
+        if self.stdin_lost:
+            raise _BrokenPipeError
+        self._stdin_transport().write(chunk)
+        await self.stdin_writable.wait()
+        if self.stdin_lost:
+            raise _BrokenPipeError
+        # always give other tasks a chance to run, even if the pipe
+        # never filled up
+        await asyncio.sleep(0)
+
+    def close_stdin(self) -> None:
+        if not self.stdin_lost:
+            # buffered data is still flushed before the pipe is closed
+            self._stdin_transport().close()
+
+    def close_stdout(self) -> None:
+        self._stdout_transport().close()
+
+    def _stdin_transport(self) -> asyncio.WriteTransport:
+        if TYPE_CHECKING:
+            assert self.transport is not None
+        return self.transport.get_pipe_transport(_STDIN)  # type: ignore[return-value]
+
+    def _stdout_transport(self) -> asyncio.ReadTransport:
+        if TYPE_CHECKING:
+            assert self.transport is not None
+        return self.transport.get_pipe_transport(_STDOUT)  # type: ignore[return-value]
+
+    def _wake_reader(self):
+        waiter = self.stdout_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _mark_done(self, what: int):
+        self._pending.discard(what)
+        if not self._pending and not self.done.done():
+            self.done.set_result(None)
+
+
+class AsyncOutputFrom:
+    """Asynchronous iterator over the standard output of a subprocess"""
+
+    __slots__ = ('_protocol', 'returncode')
+
+    def __init__(self, protocol: _SubprocessProtocol):
+        self._protocol = protocol
+        self.returncode: int | None = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        chunk = await self._protocol.read()
+        if not chunk:
+            raise StopAsyncIteration
+        return chunk
+
+
+async def _feed(
+    protocol: _SubprocessProtocol,
+    input_chunks: Iterable[bytes] | AsyncIterable[bytes],
+) -> None:
+    try:
+        if isinstance(input_chunks, AsyncIterable):
+            async for chunk in input_chunks:
+                await protocol.write(chunk)
+        else:
+            for chunk in input_chunks:
+                await protocol.write(chunk)
+    finally:
+        protocol.close_stdin()
+
+
+@asynccontextmanager
+async def iterable_subprocess_async(
+    program: list[str],
+    input_chunks: Iterable[bytes] | AsyncIterable[bytes],
+    chunk_size: int = 65536,
+    cwd: PathLike | str | None = None,
+) -> AsyncIterator[AsyncOutputFrom]:
+    """Asynchronous subprocess execution context manager with iterable IO
+
+    This is the ``asyncio`` counterpart of ``iterable_subprocess()``, with
+    the same semantics. Instead of two threads per subprocess, all pipes are
+    served by the running event loop. This makes it suitable for running
+    many subprocesses concurrently.
+
+    Standard input is populated by a task that iterates over
+    ``input_chunks``, which can be a regular or an asynchronous iterable.
+    The ``as``-variable is an asynchronous iterator over chunks of the
+    process's standard output.
+
+    On context exit, the process's standard output is closed, and the
+    context waits for the process to exit. If the process exited with a
+    non-zero return code, a ``CommandError`` is raised that contains the
+    final ``chunk_size`` bytes of the process's standard error.
+
+    If the context is exited due to an exception, the process is terminated,
+    and the exception is re-raised. The ``returncode``-attribute of the
+    ``as``-variable always contains the return code of the process.
+
+    >>> async def run():
+    ...     async with iterable_subprocess_async(['cat'], [b'test']) as proc:
+    ...         async for chunk in proc:
+    ...             print(chunk)
+    >>> asyncio.run(run())
+    b'test'
+    """
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.subprocess_exec(
+        lambda: _SubprocessProtocol(chunk_size),
+        *program,
+        stdin=PIPE,
+        stdout=PIPE,
+        stderr=PIPE,
+        cwd=cwd,
+    )
+    output = AsyncOutputFrom(protocol)
+    feeder = asyncio.ensure_future(_feed(protocol, input_chunks))
+    try:
+        try:
+            yield output
+        except BaseException:
+            with suppress(ProcessLookupError):
+                transport.terminate()
+            raise
+        finally:
+            protocol.close_stdout()
+            await asyncio.shield(protocol.done)
+            if not feeder.done():
+                # the process is gone, but the input iterable still blocks
+                feeder.cancel()
+            # asyncio.wait() does not raise the feeder's exception, only a
+            # cancellation of this coroutine itself, which must propagate
+            await asyncio.wait([feeder])
+            output.returncode = transport.get_returncode()
+        try:
+            feeder.result()
+        except _BrokenPipeError:
+            if not output.returncode:
+                msg = 'process closed its standard input while running'
+                raise BrokenPipeError(msg) from None
+        except asyncio.CancelledError:
+            pass
+    finally:
+        transport.close()
+
+    if output.returncode:
+        raise CommandError(
+            cmd=program,
+            returncode=output.returncode,
+            stderr=bytes(protocol.stderr_tail[-chunk_size:]),
+            cwd=cwd,
+        )
@@ -8,11 +8,17 @@ from threading import Thread
 import psutil
 import pytest
 
+if sys.platform.startswith('linux'):
+    import fcntl
+
 from .iterable_subprocess import (
     CommandError,
     iterable_subprocess,
 )
 
+# input chunk that fills a typical pipe buffer with a single write
+BLOB = b'*' * 65536
+
 
 def test_cat_not_necessarily_streamed():
     def yield_small_input():
@@ -30,15 +36,17 @@ def test_cat_streamed():
     def yield_input():
         nonlocal latest_input
 
-        for i in range(10000000):
-            yield b'*' * 10
+        # about 100MB, like 10M 10-byte chunks previously, but with far
+        # fewer writes
+        for i in range(1600):
+            yield BLOB
             latest_input = i
 
-    with iterable_subprocess(['cat'], yield_input()) as output:
+    with iterable_subprocess(['cat'], yield_input(), chunk_size=65536) as output:
         latest_input_during_output = [latest_input for _ in output]
 
         # Make sure the input is progressing during the output. In test, there
-        # are about 915 steps, so checking that it's greater than 50 shouldm't
+        # are several hundred steps, so checking that it's greater than 50 shouldm't
         # make this test too flakey
         num_steps = 0
         prev_i = 0
@@ -50,6 +58,15 @@ def test_cat_streamed():
         assert num_steps > 50
 
 
+def test_cat_readinto():
+    received = bytearray()
+    buf = bytearray(1000)
+    with iterable_subprocess(['cat'], [BLOB, BLOB]) as output:
+        while n := output.readinto(buf):
+            received += buf[:n]
+    assert received == BLOB + BLOB
+
+
 def test_process_closed_after():
     # in datalad-next we do not necessarily have no child-processes
     # so determine the number of test incrementally
@@ -103,9 +120,10 @@ def test_exception_from_output_during_input_iterating_propagates_and_does_not_ha
     event = threading.Event()
 
     def yield_input():
+        blob = b'*' * size
         while True:
             event.set()
-            yield b'*' * size
+            yield blob
 
     with pytest.raises(Exception, match='My error'):
         with iterable_subprocess(['cat'], yield_input()) as output:
@@ -134,8 +152,9 @@ def test_exception_from_output_iterating_propagates_and_does_not_hang(
     at_iteration, chunk_size
 ):
     def yield_input():
+        blob = b'*' * chunk_size
         while True:
-            yield b'*' * chunk_size
+            yield blob
 
     with pytest.raises(Exception, match='My error'):
         with iterable_subprocess(
@@ -192,12 +211,15 @@ def test_exception_from_return_code_with_long_standard_error():
 
     assert excinfo.value.returncode == 2
     assert len(excinfo.value.stderr) == 65536
+    # the most recent output is kept, in order
+    stderr = excinfo.value.stderr.rstrip()
+    assert stderr == (b'Error message' * 100000)[-len(stderr) :]
 
 
 def test_if_process_exits_with_non_zero_error_code_and_inner_exception_it_propagates():
     def yield_input():
         while True:
-            yield b'*' * 10
+            yield BLOB
 
     with pytest.raises(Exception, match='Another exception'):
         with iterable_subprocess(
@@ -218,7 +240,7 @@ def test_if_process_exits_with_non_zero_error_code_and_inner_exception_it_propag
 def test_if_process_closes_standard_input_but_exits_with_non_zero_error_code_then_broken_pipe_error():
     def yield_input():
         while True:
-            yield b'*' * 10
+            yield BLOB
 
     with pytest.raises(BrokenPipeError):
         with iterable_subprocess(
@@ -238,7 +260,7 @@ def test_if_process_closes_standard_input_but_exits_with_non_zero_error_code_the
 def test_if_process_closes_standard_input_but_exits_with_non_zero_error_code_then_iterable_subprocess_error():
     def yield_input():
         while True:
-            yield b'*' * 10
+            yield BLOB
 
     with pytest.raises(CommandError) as excinfo:
         with iterable_subprocess(
@@ -394,6 +416,25 @@ def test_funzip_deflate():
         assert b''.join(output) == contents
 
 
+def test_funzip_to_file(tmp_path):
+    contents = b'*' * 100000
+
+    def yield_input():
+        file = io.BytesIO()
+        with zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('any.txt', contents)
+
+        yield file.getvalue()
+
+    target = tmp_path / 'any.txt'
+    with target.open('wb') as f, iterable_subprocess(
+        ['funzip'], yield_input(), stdout=f
+    ) as output:
+        # output goes to the file directly
+        assert b''.join(output) == b''
+    assert target.read_bytes() == contents
+
+
 def test_error_returncode_available_from_generator():
     with pytest.raises(CommandError):
         with iterable_subprocess(['ls', 'does-not-exist'], ()) as ls:
@@ -423,3 +464,13 @@ def test_returncode_available_from_generator_with_exception():
     # StopIteration, e.g. a CommandError because echo could not be found, would
     # lead to an early test-exit and not proceed to the assign-statement.
     assert echo.returncode in (0, 1, -15)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason='pipe sizes are Linux-specific'
+)
+def test_stdout_pipe_holds_a_chunk():
+    with iterable_subprocess(['cat'], (), chunk_size=262144) as output:
+        # F_GETPIPE_SZ
+        assert fcntl.fcntl(output.stdout.fileno(), 1032) >= 262144
+        assert b''.join(output) == b''
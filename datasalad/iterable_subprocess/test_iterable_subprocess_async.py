@@ -0,0 +1,108 @@
+import asyncio
+import sys
+
+import pytest
+
+from .iterable_subprocess import CommandError
+from .iterable_subprocess_async import iterable_subprocess_async
+
+
+async def _collect(program, input_chunks, **kwargs):
+    async with iterable_subprocess_async(program, input_chunks, **kwargs) as output:
+        return b''.join([chunk async for chunk in output])
+
+
+def test_async_cat():
+    assert asyncio.run(_collect(['cat'], [b'first', b'second'])) == b'firstsecond'
+
+
+def test_async_cat_async_input():
+    async def yield_input():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield str(i).encode()
+
+    assert asyncio.run(_collect(['cat'], yield_input())) == b'012'
+
+
+def test_async_cat_large_streamed():
+    chunk = b'*' * 1000
+    n_chunks = 10000
+
+    async def run():
+        async with iterable_subprocess_async(
+            ['cat'], (chunk for _ in range(n_chunks)), chunk_size=4096
+        ) as output:
+            return [len(c) async for c in output]
+
+    sizes = asyncio.run(run())
+    assert sum(sizes) == len(chunk) * n_chunks
+    assert max(sizes) <= 4096  # noqa: PLR2004
+
+
+def test_async_concurrent_processes():
+    async def run():
+        return await asyncio.gather(
+            *(_collect(['cat'], [str(i).encode()]) for i in range(10))
+        )
+
+    assert asyncio.run(run()) == [str(i).encode() for i in range(10)]
+
+
+def test_async_error_with_stderr():
+    async def run():
+        async with iterable_subprocess_async(
+            [sys.executable, '-c', 'import sys; sys.stderr.write("oops"); sys.exit(3)'],
+            (),
+        ) as output:
+            async for _ in output:
+                pass
+
+    with pytest.raises(CommandError) as e:
+        asyncio.run(run())
+    assert e.value.returncode == 3  # noqa: PLR2004
+    assert e.value.stderr == b'oops'
+
+
+def test_async_exception_from_input_propagated():
+    async def yield_input():
+        yield b'*'
+        msg = 'Something went wrong'
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match='Something went wrong'):
+        asyncio.run(_collect(['cat'], yield_input()))
+
+
+def test_async_exception_in_context_terminates():
+    output = None
+
+    async def run():
+        nonlocal output
+        async with iterable_subprocess_async(['sleep', '10'], ()) as output:
+            msg = 'Something went wrong'
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match='Something went wrong'):
+        asyncio.run(run())
+    assert output is not None
+    assert output.returncode != 0
+
+
+def test_async_long_output_interrupted_on_exit():
+    async def run():
+        async with iterable_subprocess_async(['yes'], ()) as output:
+            async for _ in output:
+                break
+
+    with pytest.raises(CommandError):
+        asyncio.run(run())
+
+
+def test_async_returncode():
+    async def run():
+        async with iterable_subprocess_async(['cat'], ()) as output:
+            pass
+        return output.returncode
+
+    assert asyncio.run(run()) == 0
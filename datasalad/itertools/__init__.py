@@ -6,6 +6,7 @@
 
     align_pattern
     decode_bytes
+    decode_lines
     itemize
     load_json
     load_json_with_flag
@@ -13,19 +14,21 @@
     route_in
 """
 
-__all__ = [
+__all__ = (
     'align_pattern',
     'decode_bytes',
+    'decode_lines',
     'itemize',
     'load_json',
     'load_json_with_flag',
     'StoreOnly',
     'route_in',
     'route_out',
-]
+)
 
 from .align_pattern import align_pattern
 from .decode_bytes import decode_bytes
+from .decode_lines import decode_lines
 from .itemize import itemize
 from .load_json import (
     load_json,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 from typing import (
     Generator,
     Iterable,
@@ -34,6 +34,10 @@ def align_pattern(iterable: Iterable[S], pattern: S) -> Generator[S, None, None]
 
     The pattern might be present multiple times in a yielded data chunk.
 
+    Data chunks can also be ``memoryview`` objects, with a ``bytes``
+    pattern. Chunks that need no joining are yielded as-is, without a copy.
+    Joined chunks are yielded as ``bytes``.
+
     Note: the ``pattern`` is compared verbatim to the content in the data
     chunks, i.e. no parsing of the ``pattern`` is performed and no regular
     expressions or wildcards are supported.
@@ -75,52 +79,72 @@ def align_pattern(iterable: Iterable[S], pattern: S) -> Generator[S, None, None]
         pattern multiple times.
     """
 
-    # Declare regex to be either str, bytes, or bytearray. This way we do not
-    # have to discriminate between bytes and bytearray in the following
-    # if-clause
-    regex: str | bytes | bytearray
-
-    # Create pattern matcher for all non-empty prefixes of the pattern
-    if isinstance(pattern, str):
-        regex = (
-            '('
-            + '|'.join(
-                '.' * (len(pattern) - index - 1) + re.escape(pattern[:index]) + '$'
-                for index in range(1, len(pattern))
-            )
-            + ')'
-        )
+    if len(pattern) <= 1:
+        # a pattern of this size cannot be split between chunks, there is
+        # nothing to join. Only empty chunks must not be passed on
+        yield from filter(None, iterable)
+        return
+
+    # all non-empty, proper prefixes of the pattern. A single `endswith()`
+    # call can test for all of them.
+    if isinstance(pattern, bytearray):
+        # a bytearray pattern is not hashable, and cannot be cached as-is
+        prefixes = _get_prefixes(bytes(pattern))
     else:
-        regex = (
-            b'('
-            + b'|'.join(
-                b'.' * (len(pattern) - index - 1) + re.escape(pattern[:index]) + b'$'
-                for index in range(1, len(pattern))
-            )
-            + b')'
-        )
-    pattern_matcher = re.compile(regex, re.DOTALL)
-    pattern_sub = len(pattern) - 1
+        prefixes = _get_prefixes(pattern)
     # Join data chunks until they are sufficiently long to contain the pattern,
     # i.e. have at least size: `len(pattern)`. Continue joining, if the chunk
     # ends with a prefix of the pattern.
-    current_chunk: S | None = None
+    # Chunks are only collected, and joined once when they are yielded. This
+    # avoids copying a growing chunk over and over again.
+    # This loop runs for every chunk, lengths and methods are looked up once.
+    pattern_len = len(pattern)
+    pending: list[S] = []
+    append_pending = pending.append
+    pending_len = 0
+    # the end of the pending data that could hold a prefix of the pattern
+    tail_len = pattern_len - 1
+    # only a chunk that ends with one of these can end with a prefix of the
+    # pattern. The last item of the pattern is not among them. Chunks that
+    # end with a complete match (a common case for patterns like end markers)
+    # are therefore yielded without a prefix test
+    prefix_ends = pattern[:-1]
+    empty_tail = pattern[:0]
+    tail = empty_tail
     for data_chunk in iterable:
-        # get the type of current_chunk from the type of this data_chunk
-        if current_chunk is None:
-            current_chunk = data_chunk
+        chunk_len = len(data_chunk)
+        append_pending(data_chunk)
+        pending_len += chunk_len
+        if chunk_len < tail_len:
+            tail = (tail + data_chunk)[-tail_len:]
+        elif isinstance(data_chunk, memoryview):
+            # a memoryview has no `endswith()`, only its tail is copied
+            tail = data_chunk[-tail_len:].tobytes()
         else:
-            current_chunk += data_chunk
-        # we type-ignore the next line, because `pattern_matcher`
-        # (ie. `Pattern`) only supports a subtype specification ala
-        # `Pattern[str]` from Python 3.9 onwards. For now we need to
-        # be compatible with Python 3.8
-        if len(current_chunk) >= len(pattern) and not (
-            current_chunk[-1] in pattern
-            and pattern_matcher.match(current_chunk, len(current_chunk) - pattern_sub)
+            tail = data_chunk
+        if pending_len >= pattern_len and not (
+            tail and tail[-1] in prefix_ends and tail.endswith(prefixes)
         ):
-            yield current_chunk
-            current_chunk = None
+            # a single chunk is passed on as-is, without a copy
+            yield data_chunk if pending_len == chunk_len else _join(pending)
+            pending.clear()
+            pending_len = 0
+            tail = empty_tail
+
+    if pending:
+        yield pending[0] if len(pending) == 1 else _join(pending)
+
+
+def _join(chunks: list[S]) -> S:
+    first = chunks[0]
+    if isinstance(first, memoryview):
+        # memoryviews cannot join, they are joined into `bytes`
+        return b''.join(chunks)
+    # joining with an empty item of the first chunk's type keeps that type
+    return first[:0].join(chunks)
+
 
-    if current_chunk is not None:
-        yield current_chunk
+@lru_cache(maxsize=128)
+def _get_prefixes(pattern: str | bytes) -> tuple:
+    # the same patterns tend to be used over and over again
+    return tuple(pattern[:i] for i in range(1, len(pattern)))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import codecs
 from typing import (
     Generator,
     Iterable,
@@ -9,6 +10,10 @@ from typing import (
 
 __all__ = ['decode_bytes']
 
+# encodings that decode any pure-ASCII byte sequence to the identical
+# characters, as a self-contained string
+_ascii_compatible = frozenset(('utf-8', 'ascii', 'iso8859-1'))
+
 
 def decode_bytes(
     iterable: Iterable[bytes],
@@ -18,10 +23,10 @@ def decode_bytes(
 ) -> Generator[str, None, None]:
     """Decode bytes in an ``iterable`` into strings
 
-    This function decodes ``bytes`` or ``bytearray`` into ``str`` objects,
-    using the specified encoding. Importantly, the decoding input can
-    be spread across multiple chunks of heterogeneous sizes, for example
-    output read from a process or pieces of a download.
+    This function decodes ``bytes``, ``bytearray``, or ``memoryview`` objects
+    into ``str`` objects, using the specified encoding. Importantly, the
+    decoding input can be spread across multiple chunks of heterogeneous
+    sizes, for example output read from a process or pieces of a download.
 
     There is no guarantee that exactly one output chunk will be yielded for
     every input chunk. Input byte strings might be split at error-locations, or
@@ -101,54 +106,32 @@ def decode_bytes(
         ``iterable`` cannot be decoded with the specified ``encoding``
     """
 
-    def handle_decoding_error(
-        position: int, exc: UnicodeDecodeError
-    ) -> tuple[int, str]:
-        """Handle a UnicodeDecodeError"""
-        if not backslash_replace:
-            # Signal the error to the caller
-            raise exc
-        return (
-            position + exc.end,
-            joined_data[position : position + exc.start].decode(encoding)
-            + joined_data[position + exc.start : position + exc.end].decode(
-                encoding, errors='backslashreplace'
-            ),
-        )
-
-    joined_data = b''
-    pending_error = None
-    position = 0
+    # the incremental decoder keeps incomplete multi-byte sequences at the
+    # end of a chunk, until the next chunk completes them
+    decoder = codecs.getincrementaldecoder(encoding)(
+        errors='backslashreplace' if backslash_replace else 'strict',
+    )
+    # pure-ASCII chunks can bypass the decoder, as long as it does not
+    # hold an incomplete sequence from a previous chunk
+    ascii_fastpath = codecs.lookup(encoding).name in _ascii_compatible
+    pending = False
     for chunk in iterable:
-        joined_data += chunk
-        while position < len(joined_data):
-            try:
-                yield joined_data[position:].decode(encoding)
-                joined_data = b''
-                # must reset the pointer for successful decoded
-                # parts too, otherwise we start too far into a new chunk's
-                # content
-                position = 0
-            except UnicodeDecodeError as e:
-                # If an encoding error occurs, we first check whether it was
-                # in the middle of `joined_data` or whether it extends until the
-                # end of `joined_data`.
-                # If it occurred in the middle of
-                # `joined_data`, we replace it with backslash encoding or
-                # re-raise the decoding error.
-                # If it occurred at the end of `joined_data`, we wait for the
-                # next chunk, which might fix the problem.
-                if position + e.end == len(joined_data):
-                    # Wait for the next chunk, which might fix the problem
-                    pending_error = e
-                    break
-                else:
-                    pending_error = None
-                    position, string = handle_decoding_error(position, e)
-                    yield string
-
-    if pending_error:
-        # If the last chunk has a decoding error at the end, process it.
-        position, string = handle_decoding_error(position, pending_error)
+        if (
+            ascii_fastpath
+            and not pending
+            # a memoryview has no `isascii()`
+            and not isinstance(chunk, memoryview)
+            and chunk.isascii()
+        ):
+            if chunk:
+                yield chunk.decode('ascii')
+            continue
+        string = decoder.decode(chunk)
+        if ascii_fastpath:
+            pending = bool(decoder.getstate()[0])
         if string:
             yield string
+    # flush any remaining incomplete sequence, this raises or replaces it
+    string = decoder.decode(b'', final=True)
+    if string:
+        yield string
@@ -0,0 +1,98 @@
+"""Get lines decoded from chunks of bytes"""
+
+from __future__ import annotations
+
+from typing import (
+    Generator,
+    Iterable,
+)
+
+from datasalad.itertools.decode_bytes import decode_bytes
+
+__all__ = ['decode_lines']
+
+# the line boundaries that `str.splitlines()` recognizes
+_line_ends = frozenset('\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+
+
+def decode_lines(
+    iterable: Iterable[bytes],
+    *,
+    encoding: str = 'utf-8',
+    backslash_replace: bool = True,
+    keep_ends: bool = False,
+) -> Generator[str, None, None]:
+    """Decode bytes in an ``iterable`` and yield complete lines
+
+    The yielded lines are the same as those from ``str.splitlines()`` on the
+    complete decoded text. Decoded strings are split into lines in the same
+    step, and are not passed through another generator.
+
+    This is similar to wrapping ``itemize()``, in splitlines-mode
+    (``sep=None``), around ``decode_bytes()``. However, ``itemize()`` reports
+    a ``\r\n`` line ending that is split across chunks as two separate line
+    endings, while this function reports a single one.
+
+    .. code-block:: python
+
+        >>> from datasalad.itertools import decode_lines
+        >>> tuple(decode_lines([b'one\\ntw', b'o\\n\\xc3', b'\\xb6']))
+        ('one', 'two', 'ö')
+
+    A ``\\r`` at the end of a chunk is held back, until the next chunk shows
+    whether it is part of a ``\\r\\n`` line ending.
+
+    Content after the last line ending is always yielded as the last line,
+    even if it is not terminated.
+
+    Parameters
+    ----------
+    iterable: Iterable[bytes]
+        Iterable that yields bytes that should be decoded
+    encoding: str (default: ``'utf-8'``)
+        Encoding to be used for decoding.
+    backslash_replace: bool (default: ``True``)
+        If ``True``, backslash-escapes are used for undecodable bytes. If
+        ``False``, a ``UnicodeDecodeError`` is raised if a byte sequence cannot
+        be decoded.
+    keep_ends: bool
+        If `True`, line endings will remain at the end of a yielded line.
+
+    Yields
+    ------
+    str
+        Decoded lines
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If ``backslash_replace`` is ``False`` and the data yielded by
+        ``iterable`` cannot be decoded with the specified ``encoding``
+    """
+    remainder = ''
+    for decoded in decode_bytes(
+        iterable,
+        encoding=encoding,
+        backslash_replace=backslash_replace,
+    ):
+        string = remainder + decoded if remainder else decoded
+        if not string:
+            continue
+        # a single split, in the requested mode
+        lines = string.splitlines(keepends=keep_ends)
+        last_char = string[-1]
+        if last_char in _line_ends and last_char != '\r':
+            remainder = ''
+        else:
+            # the last line is incomplete, or might be followed by the `\n`
+            # of a `\r\n` ending. Keep it for the next chunk, with its
+            # ending
+            remainder = lines.pop()
+            if last_char == '\r' and not keep_ends:
+                remainder += '\r'
+            if not lines:
+                continue
+        yield from lines
+
+    if remainder:
+        yield from remainder.splitlines(keepends=keep_ends)
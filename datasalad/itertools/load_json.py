@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
 from typing import (
+    TYPE_CHECKING,
     Any,
     Generator,
     Iterable,
 )
 
+if TYPE_CHECKING:
+    import json
+
 __all__ = ['load_json', 'load_json_with_flag']
 
 
@@ -61,8 +64,12 @@ def load_json(
     json.decoder.JSONDecodeError
         If the data yielded by ``iterable`` is not a valid JSON-string
     """
+    # `json` is only imported on use, importing `datasalad.itertools` need
+    # not pay for it
+    from json import loads  # noqa: PLC0415
+
     for json_string in iterable:
-        yield json.loads(json_string)
+        yield loads(json_string)
 
 
 def load_json_with_flag(
@@ -105,8 +112,14 @@ def load_json_with_flag(
         ``json.decoder.JSONDecodeError`` that was raised during JSON-decoding
         and ``False``.
     """
+    # see `load_json()` for the deferred import
+    from json import (  # noqa: PLC0415
+        JSONDecodeError,
+        loads,
+    )
+
     for json_string in iterable:
         try:
-            yield json.loads(json_string), True
-        except json.decoder.JSONDecodeError as e:
+            yield loads(json_string), True
+        except JSONDecodeError as e:
             yield e, False
@@ -21,6 +21,17 @@ from ..align_pattern import align_pattern
         # returned as a remainder, because it ends with a pattern prefix.
         (['a', 'b', 'c', 'dddbbb', 'a'], 'abc', ['abc', 'dddbbb', 'a']),
         (['a', 'b', 'c', '9', 'a'], 'abc', ['abc', '9a']),
+        # Self-overlapping pattern prefixes are detected
+        (['a', 'a', 'a', 'b', 'x'], 'aab', ['aaab', 'x']),
+        (['xaba', 'b', 'a', 'b', 'c'], 'ababc', ['xabababc']),
+        # A chunk that ends with a complete match is not joined further,
+        # unless it also ends with a prefix of the pattern
+        (['x', 'abc\n', 'ab', 'c\n'], 'abc\n', ['xabc\n', 'abc\n']),
+        (['xaba', 'c', 'd'], 'aba', ['xabac', 'd']),
+        # bytearray patterns are supported too
+        ([b'a', b'bc', b'd'], bytearray(b'bcd'), [b'abcd']),
+        # Single-item patterns cannot be split, chunks are passed through
+        (['a', 'b', '', 'c\n', 'd'], '\n', ['a', 'b', 'c\n', 'd']),
     ],
 )
 def test_pattern_processor(data_chunks, pattern, expected):
@@ -34,3 +45,22 @@ def test_newline_matches():
     chunk3 = b'kram-dne-dalatad----\n'
     result = list(align_pattern([chunk1, chunk2, chunk3], pattern))
     assert result == [chunk1 + chunk2 + chunk3]
+
+
+def test_joined_chunk_type():
+    chunks = [bytearray(b'ab'), bytearray(b'c'), bytearray(b'de')]
+    result = list(align_pattern(chunks, pattern=b'xyz'))
+    assert result == [bytearray(b'abc'), bytearray(b'de')]
+    assert all(type(r) is bytearray for r in result)
+    # a single chunk is passed on as-is
+    assert next(align_pattern(chunks, pattern=b'xy')) is chunks[0]
+
+
+def test_memoryview_chunks():
+    data = memoryview(b'abcdefghij')
+    chunks = [data[:2], data[2:3], data[3:6], data[6:]]
+    result = list(align_pattern(chunks, pattern=b'cde'))
+    assert result == [b'abcdef', b'ghij']
+    assert type(result[0]) is bytes
+    # a single chunk is passed on as-is
+    assert result[1] is chunks[-1]
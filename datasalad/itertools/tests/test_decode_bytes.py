@@ -47,3 +47,25 @@ def test_error_chunks():
     # cause data loss in a subsequent chunk
     r = ''.join(decode_bytes([b'08 War \xaf No', b'1234567890']))
     assert r == '08 War \\xaf No1234567890'
+
+
+def test_sequence_across_many_chunks():
+    encoded = '😀'.encode()
+    r = tuple(decode_bytes([encoded[i : i + 1] for i in range(len(encoded))]))
+    assert r == ('😀',)
+
+
+def test_ascii_chunks_after_incomplete_sequence():
+    encoded = 'ö'.encode()
+    # an ASCII chunk must not overtake an incomplete sequence, and
+    # the sequence must still be reported as undecodable
+    r = tuple(decode_bytes([b'abc', encoded[:1], b'def', b'ghi']))
+    assert r == ('abc', '\\xc3def', 'ghi')
+    r = tuple(decode_bytes([b'abc', encoded[:1], encoded[1:], b'def']))
+    assert r == ('abc', 'ö', 'def')
+
+
+def test_memoryview_chunks():
+    data = memoryview('abcö'.encode())
+    r = tuple(decode_bytes([data[:2], data[2:4], data[4:]]))
+    assert ''.join(r) == 'abcö'
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from ..decode_bytes import decode_bytes
+from ..decode_lines import decode_lines
+from ..itemize import itemize
+
+byte_chunks = [b'abc', b'def\n012', b'\n', b'\n', b'\xc3', b'\xb6\r\n', b'x']
+
+
+@pytest.mark.parametrize('keep_ends', [True, False])
+def test_same_as_itemize(keep_ends):
+    assert tuple(decode_lines(byte_chunks, keep_ends=keep_ends)) == tuple(
+        itemize(decode_bytes(byte_chunks), None, keep_ends=keep_ends)
+    )
+
+
+def test_split_crlf():
+    r = tuple(decode_lines([b'a\r', b'\nb\r', b'\r\n', b'c\r']))
+    assert r == ('a', 'b', '', 'c')
+    r = tuple(decode_lines([b'a\r', b'\nb\r', b'\r\n', b'c\r'], keep_ends=True))
+    assert r == ('a\r\n', 'b\r', '\r\n', 'c\r')
+
+
+def test_crlf_across_chunks():
+    chunks = [b'one\r', b'\ntwo\r', b'\nthree']
+    # same as splitting the complete text
+    text = b''.join(chunks).decode()
+    assert tuple(decode_lines(chunks)) == tuple(text.splitlines())
+    assert tuple(decode_lines(chunks, keep_ends=True)) == tuple(
+        text.splitlines(keepends=True)
+    )
+    # `itemize()` sees two separate line endings here
+    assert tuple(itemize(decode_bytes(chunks), None)) == (
+        'one',
+        '',
+        'two',
+        '',
+        'three',
+    )
+
+
+def test_decoding_errors():
+    r = tuple(decode_lines([b'a\n\xc3', b'\n']))
+    assert r == ('a', '\\xc3')
+    with pytest.raises(UnicodeDecodeError):
+        tuple(decode_lines([b'a\n\xc3', b'\n'], backslash_replace=False))
@@ -10,9 +10,15 @@ Execution errors are communicated with the
 
    CommandError
    iter_subproc
+   iter_subproc_session
+   SubprocSession
 """
 
-__all__ = ['CommandError', 'iter_subproc']
+__all__ = ['CommandError', 'SubprocSession', 'iter_subproc', 'iter_subproc_session']
 
 from .exception import CommandError
 from .iter_subproc import iter_subproc
+from .iter_subproc_session import (
+    SubprocSession,
+    iter_subproc_session,
+)
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import codecs
+import os
+import signal
+import sys
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    import os
+# signal number to name mapping, instead of an `Enum` value lookup
+# for each report
+_signal_names = {s.value: s.name for s in signal.Signals}
 
-import signal
-import sys
+# optional `CommandError` arguments with their defaults, in the order
+# in which they are reported by `CommandError.__repr__()`
+_repr_fields = (
+    ('msg', ''),
+    ('returncode', None),
+    ('stdout', ''),
+    ('stderr', ''),
+    ('cwd', None),
+)
 
 
 class CommandError(RuntimeError):
@@ -39,6 +51,17 @@ class CommandError(RuntimeError):
             raise e
     """
 
+    __slots__ = (
+        '_cmd_repr',
+        '_str_cache',
+        'cmd',
+        'cwd',
+        'msg',
+        'returncode',
+        'stderr',
+        'stdout',
+    )
+
     def __init__(
         self,
         cmd: str | list[str],
@@ -48,15 +71,40 @@ class CommandError(RuntimeError):
         stderr: str | bytes = '',
         cwd: str | os.PathLike | None = None,
     ) -> None:
-        RuntimeError.__init__(self, msg)
+        super().__init__(msg)
         self.cmd = cmd
         self.msg = msg
         self.returncode = returncode
         self.stdout = stdout
         self.stderr = stderr
         self.cwd = cwd
+        # the message is only rendered when needed, see `__str__()`
+        self._str_cache: tuple[tuple, str] | None = None
+        # the full command representation is only built when needed, see
+        # `__repr__()`
+        self._cmd_repr: tuple[str | list[str], str] | None = None
+
+    def __reduce__(self):
+        # attributes in slots are not covered by the default pickle support
+        # of exceptions, which only considers `args` and `__dict__`
+        return (
+            self.__class__,
+            (self.cmd, self.msg, self.returncode, self.stdout, self.stderr, self.cwd),
+            self.__dict__ or None,
+        )
 
     def __str__(self) -> str:
+        # exceptions are often caught and discarded without ever being
+        # reported. The message is only rendered on first use, and cached.
+        # Attributes like `msg` may be amended after the exception was
+        # created, hence the cache is tied to the attribute values
+        key = (self.cmd, self.msg, self.returncode, self.stderr, self.cwd)
+        cache = self._str_cache
+        if cache is None or cache[0] != key:
+            cache = self._str_cache = (key, self._render_str())
+        return cache[1]
+
+    def _render_str(self) -> str:
         # we report the command verbatim, in exactly the form that it has
         # been given to the exception. Previously implementation have
         # beautified output by joining list-format commands with shell
@@ -64,72 +112,113 @@ class CommandError(RuntimeError):
         # actually run locally. In practice, CommandError is also used
         # to report on remote command execution failure. Reimagining
         # quoting and shell conventions based on assumptions is confusing.
-        to_str = f'Command {self.cmd!r}'
+        # Only very long argument lists are shortened.
+        # message parts are collected and joined once at the end.
+        parts = [f'Command {_short_repr(self.cmd)}']
         if self.returncode and self.returncode < 0:
-            try:
-                to_str += f' died with {signal.Signals(-self.returncode).name}'
-            except ValueError:
-                to_str += f' died with unknown signal {-self.returncode}'
+            signame = _signal_names.get(-self.returncode)
+            if signame:
+                parts.append(f' died with {signame}')
+            else:
+                parts.append(f' died with unknown signal {-self.returncode}')
         elif self.returncode:
-            to_str += f' returned non-zero exit status {self.returncode}'
+            parts.append(f' returned non-zero exit status {self.returncode}')
         else:
-            to_str += ' errored with unknown exit status'
+            parts.append(' errored with unknown exit status')
         if self.cwd:
-            # only if not under standard PWD
-            to_str += f' at CWD {self.cwd}'
+            # only if not under standard PWD.
+            # a `str` needs no conversion, any other path-like object
+            # is reported by its file system representation
+            cwd = self.cwd if isinstance(self.cwd, str) else os.fsdecode(self.cwd)
+            parts.append(f' at CWD {cwd}')
         if self.msg:
             # typically a command error has no specific idea
             # but we support it, because CommandError derives
             # from RuntimeError which has this feature.
-            to_str += f' [{self.msg}]'
-
-        if not self.stderr:
-            return to_str
-
-        # make an effort to communicate stderr
-        stderr = ''
-        if isinstance(self.stderr, bytes):
-            # assume that the command output matches the local system
-            # encoding
-            try:
-                # we need to try conversion on the full bytestring to
-                # avoid alignment issues with random splits
-                stderr = self.stderr.decode(sys.getdefaultencoding())
-            except UnicodeDecodeError:
-                # we tried, we failed, sorry
-                # we are not guessing other encodings. If it doesn't
-                # match the system encoding, it is somewhat unlikely
-                # to be an informative error message.
-                stderr = f'<undecodable {truncate_bytes(self.stderr)}>'
-        else:
-            stderr = self.stderr
+            parts.append(f' [{self.msg}]')
 
-        to_str += f' [stderr: {truncate_str(stderr, (60, 0))}]'
+        if self.stderr:
+            # make an effort to communicate stderr
+            if isinstance(self.stderr, str):
+                # nothing to decode
+                stderr = truncate_str(self.stderr, (60, 0))
+            else:
+                stderr = _truncate_decode(self.stderr, 60)
+            parts.append(f' [stderr: {stderr}]')
 
-        return to_str
+        return ''.join(parts)
+
+    def _get_cmd_repr(self) -> str:
+        # a long argument list is costly to represent, and `repr()` is
+        # often called repeatedly, e.g., by logging. Cache per command object
+        cache = self._cmd_repr
+        if cache is None or cache[0] is not self.cmd:
+            cache = self._cmd_repr = (self.cmd, repr(self.cmd))
+        return cache[1]
 
     def __repr__(self) -> str:
-        descr = f'{self.__class__.__name__}({self.cmd!r}'
-        for kwarg, (val, default) in {
-            'msg': (self.msg, ''),
-            'returncode': (self.returncode, None),
-            'stdout': (self.stdout, ''),
-            'stderr': (self.stderr, ''),
-            'cwd': (self.cwd, None),
-        }.items():
+        # like in `__str__()`, parts are collected and joined once
+        parts = [f'{self.__class__.__name__}({self._get_cmd_repr()}']
+        for kwarg, default in _repr_fields:
+            val = getattr(self, kwarg)
             if val == default:
                 continue
             if kwarg in ('stdout', 'stderr'):
                 if TYPE_CHECKING:
                     assert isinstance(val, (str, bytes))
                 if isinstance(val, bytes):
-                    descr += f", {kwarg}=b'<{truncate_bytes(val)}>'"
+                    parts.append(f", {kwarg}=b'<{truncate_bytes(val)}>'")
                 else:
-                    descr += f', {kwarg}={truncate_str(val)!r}'
+                    parts.append(f', {kwarg}={truncate_str(val)!r}')
             else:
-                descr += f', {kwarg}={val!r}'
-        descr += ')'
-        return descr
+                parts.append(f', {kwarg}={val!r}')
+        parts.append(')')
+        return ''.join(parts)
+
+
+def _short_repr(cmd: str | list[str], max_len: int = 512) -> str:
+    # commands can come with thousands of arguments (e.g., pathspecs).
+    # Only report as many as fit into `max_len` characters, the full
+    # command remains available via `CommandError.cmd`
+    if not isinstance(cmd, list):
+        return repr(cmd)
+    parts = []
+    length = 0
+    for i, arg in enumerate(cmd):
+        arg_repr = repr(arg)
+        length += len(arg_repr) + 2
+        if i and length > max_len:
+            parts.append(f'... (+{len(cmd) - i} more)')
+            break
+        parts.append(arg_repr)
+    return f'[{", ".join(parts)}]'
+
+
+def _truncate_decode(data: bytes, front: int) -> str:
+    # assume that the command output matches the local system encoding.
+    # Only as many bytes are decoded as can make up the `front` characters
+    # that are reported, at most 4 bytes per character (UTF-8).
+    # Decoding all of a large stderr would be wasted on the truncated part
+    complete = len(data) <= front * 4
+    encoding = sys.getdefaultencoding()
+    try:
+        if complete:
+            # no slicing, no decoder setup needed
+            text = data.decode(encoding)
+        else:
+            # the incremental decoder does not choke on a multi-byte
+            # sequence that is split at the end of the partial read
+            text = codecs.getincrementaldecoder(encoding)().decode(data[: front * 4])
+    except UnicodeDecodeError:
+        # we tried, we failed, sorry
+        # we are not guessing other encodings. If it doesn't
+        # match the system encoding, it is somewhat unlikely
+        # to be an informative error message.
+        return f'<undecodable {truncate_bytes(data)}>'
+    if complete:
+        return truncate_str(text, (front, 0))
+    text = text[:front]
+    return f'{text}<... +{len(data) - len(text.encode(encoding))} bytes>'
 
 
 def truncate_bytes(data: bytes) -> str:
@@ -139,11 +228,12 @@ def truncate_bytes(data: bytes) -> str:
 def truncate_str(text: str, keep: tuple[int, int] = (20, 20)) -> str:
     # truncation like done below only actually shortens beyond
     # 60 chars input length
+    text_len = len(text)
     front, back = keep
-    if len(text) < (front + back + 14):
-        # stringify only
-        return f'{text}'
+    if text_len < (front + back + 14):
+        # nothing to shorten, no need for a copy either
+        return text
     return (
-        f"{text[:front]}<... +{len(text) - front - back} chars>"
+        f"{text[:front]}<... +{text_len - front - back} chars>"
         f"{text[-back:] if back > 0 else ''}"
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import (
+    IO,
     TYPE_CHECKING,
     Iterable,
 )
@@ -30,7 +31,8 @@ def iter_subproc(
     inputs: Iterable[bytes] | None = None,
     chunk_size: int = COPY_BUFSIZE,
     cwd: Path | None = None,
-    bufsize: int = -1,
+    bufsize: int = COPY_BUFSIZE,
+    stdout: int | IO | None = None,
 ):
     """Context manager to communicate with a subprocess using iterables
 
@@ -99,6 +101,12 @@ def iter_subproc(
      StopIteration() 2
 
 
+    Output is only read from the subprocess when the ``as``-variable is
+    iterated, it is not collected in the background. Consumers that only need
+    the first part of the output can simply stop iterating and leave the
+    context. If only the exit status is of interest, ``stdout`` can be set to
+    ``subprocess.DEVNULL``, and the output does not reach this process at all.
+
     Parameters
     ----------
     args: list
@@ -107,12 +115,24 @@ def iter_subproc(
       If given, chunks of ``bytes`` to be written, iteratively, to the
       subprocess's ``stdin``.
     chunk_size: int, optional
-      Size of chunks to read from the subprocess's stdout/stderr in bytes.
+      Maximum size of chunks to read from the subprocess's stdout/stderr
+      in bytes. Output is yielded as soon as it is available, hence chunks
+      can be smaller. On Linux, the ``stdout`` pipe is enlarged to hold
+      a full chunk, if the system permits it. Larger chunks mean fewer reads
+      for large outputs, at the expense of memory.
     cwd: Path
       Working directory for the subprocess, passed to ``subprocess.Popen``.
     bufsize: int, optional
       Buffer size to use for the subprocess's ``stdin``, ``stdout``, and
-      ``stderr``. See ``subprocess.Popen`` for details.
+      ``stderr``. See ``subprocess.Popen`` for details. The default matches
+      the default ``chunk_size``, such that small input chunks are gathered
+      into writes of that size. Output is read from the pipes directly, and
+      is not affected by this buffer.
+    stdout: int | file object, optional
+      If given, the subprocess's ``stdout`` is connected to this file
+      descriptor or file object (or ``subprocess.DEVNULL``), instead of a
+      pipe. The process then writes its output there directly, and
+      iterating over the ``as``-variable yields nothing.
 
     Returns
     -------
@@ -124,4 +144,5 @@ def iter_subproc(
         chunk_size=chunk_size,
         cwd=cwd,
         bufsize=bufsize,
+        stdout=stdout,
     )
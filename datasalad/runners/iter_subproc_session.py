@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from queue import Queue
+from typing import (
+    TYPE_CHECKING,
+    Generator,
+    Iterator,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+from datasalad import iterable_subprocess
+from datasalad.itertools import itemize
+from datasalad.runners.iter_subproc import COPY_BUFSIZE
+
+__all__ = ['SubprocSession', 'iter_subproc_session']
+
+
+class SubprocSession:
+    """Communication handle for a long-running subprocess
+
+    Instances are created by :func:`iter_subproc_session`, and should not
+    be created directly.
+    """
+
+    __slots__ = ('_output', '_requests', '_responses')
+
+    def __init__(
+        self,
+        requests: Queue[bytes | None],
+        output: Iterator[bytes],
+        sep: bytes,
+    ):
+        self._requests = requests
+        self._output = output
+        self._responses = itemize(output, sep, keep_ends=False)
+
+    def run(self, request: bytes) -> bytes:
+        """Send a request to the subprocess and return its response
+
+        The request must be formatted as expected by the subprocess,
+        including any terminator (e.g., a newline). The response is
+        returned without the separator that terminates it.
+
+        Raises
+        ------
+        EOFError
+          When the subprocess closed its output before responding.
+        """
+        self._requests.put(request)
+        try:
+            return next(self._responses)
+        except StopIteration:
+            msg = 'subprocess closed its output before responding'
+            raise EOFError(msg) from None
+
+    @property
+    def returncode(self) -> int | None:
+        """Return code of the subprocess, once it has exited"""
+        return getattr(self._output, 'returncode', None)
+
+
+def _iter_requests(requests: Queue[bytes | None]) -> Generator[bytes, None, None]:
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+        yield request
+
+
+@contextmanager
+def iter_subproc_session(
+    args: list[str],
+    *,
+    sep: bytes = b'\n',
+    chunk_size: int = COPY_BUFSIZE,
+    cwd: Path | None = None,
+) -> Generator[SubprocSession, None, None]:
+    """Context manager to run many requests through a single subprocess
+
+    Many tools offer a batch-mode that reads requests from ``stdin``,
+    and writes one response per request to ``stdout`` (for example,
+    ``git cat-file --batch-check``, or ``git annex ... --batch``). Running
+    such a process once, and sending all requests through it, avoids the
+    cost of starting a new process for each request.
+
+    The subprocess is run with
+    :func:`~datasalad.iterable_subprocess.iterable_subprocess`, the same
+    machinery that :func:`~datasalad.runners.iter_subproc` uses. Its
+    ``stdin`` is fed from an internal queue of requests. On entering the
+    context, the subprocess is started. The ``as``-variable is a
+    :class:`SubprocSession` whose ``run()`` method sends a request, and
+    returns the response. Responses must be terminated by ``sep``. On
+    context exit, the subprocess's ``stdin`` is closed, which typically
+    makes a batch-mode process exit. A ``CommandError`` is raised if the
+    process exited with a non-zero return code, unless the context is left
+    with an exception. In that case, the process is terminated, and the
+    exception is re-raised.
+
+    Requests are written to the subprocess without buffering. Any request
+    must yield exactly one response, otherwise ``run()`` blocks.
+
+    >>> with iter_subproc_session(['cat']) as session:
+    ...     session.run(b'one\\n')
+    ...     session.run(b'two\\n')
+    b'one'
+    b'two'
+
+    Parameters
+    ----------
+    args: list
+      Sequence of program arguments to be passed to ``subprocess.Popen``.
+    sep: bytes, optional
+      Separator that terminates each response on the subprocess's
+      ``stdout``.
+    chunk_size: int, optional
+      Maximum size of chunks to read from the subprocess's stdout/stderr
+      in bytes.
+    cwd: Path
+      Working directory for the subprocess, passed to ``subprocess.Popen``.
+
+    Returns
+    -------
+    contextmanager
+    """
+    requests: Queue[bytes | None] = Queue()
+    with iterable_subprocess.iterable_subprocess(
+        args,
+        _iter_requests(requests),
+        chunk_size=chunk_size,
+        cwd=cwd,
+        # requests must reach the process immediately
+        bufsize=0,
+    ) as output:
+        try:
+            yield SubprocSession(requests, output, sep)
+        finally:
+            # end the input. This stops the thread feeding the process,
+            # and lets a batch-mode process exit
+            requests.put(None)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import pickle
 import sys
+from pathlib import PurePosixPath
 
 import pytest
 
@@ -37,8 +39,10 @@ def test_CommandError_str_repr() -> None:
                 cwd='<cwd>',
             ),
             "Command '<cmd>' returned non-zero exit status 1 at CWD <cwd> [<msg>] [stderr: <stderr>]",
-            "CommandError('<cmd>', msg='<msg>', returncode=1, stdout='<stdout>', "
-            "stderr='<stderr>', cwd='<cwd>')",
+            (
+                "CommandError('<cmd>', msg='<msg>', returncode=1, stdout='<stdout>', "
+                "stderr='<stderr>', cwd='<cwd>')"
+            ),
         ),
         (
             CommandError('mycmd', stdout=unicode_out),
@@ -65,6 +69,23 @@ def test_CommandError_str_repr() -> None:
             f"Command 'mycmd' errored with unknown exit status [stderr: {unicode_out}]",
             f"CommandError('mycmd', stderr='{unicode_out[:20]}<... +14 chars>{unicode_out[-20:]}')",
         ),
+        (
+            CommandError('mycmd', stderr=b'x' * 1000),
+            (
+                "Command 'mycmd' errored with unknown exit status "
+                f'[stderr: {"x" * 60}<... +940 bytes>]'
+            ),
+            "CommandError('mycmd', stderr=b'<1000 bytes>')",
+        ),
+        (
+            # only the reported part of a long stderr needs to be decodable
+            CommandError('mycmd', stderr='ö'.encode() * 500 + cp1252_out),
+            (
+                "Command 'mycmd' errored with unknown exit status "
+                f'[stderr: {"ö" * 60}<... +885 bytes>]'
+            ),
+            "CommandError('mycmd', stderr=b'<1005 bytes>')",
+        ),
     ]
     if not sys.platform.startswith('win'):
         testcases.extend(
@@ -79,8 +100,10 @@ def test_CommandError_str_repr() -> None:
                 # encoded string to provoke a decoding error
                 (
                     CommandError('mycmd', stderr=cp1252_out),
-                    "Command 'mycmd' errored with unknown exit status "
-                    '[stderr: <undecodable 5 bytes>]',
+                    (
+                        "Command 'mycmd' errored with unknown exit status "
+                        '[stderr: <undecodable 5 bytes>]'
+                    ),
                     "CommandError('mycmd', stderr=b'<5 bytes>')",
                 ),
             )
@@ -90,6 +113,33 @@ def test_CommandError_str_repr() -> None:
         assert repr(ce) == _repr
 
 
+def test_CommandError_long_cmd() -> None:
+    cmd = ['git', 'add', '--'] + [f'file{i:04d}' for i in range(1000)]
+    ce = CommandError(cmd, returncode=1)
+    msg = str(ce)
+    assert msg.startswith("Command ['git', 'add', '--', 'file0000', ")
+    assert msg.endswith(' more)] returned non-zero exit status 1')
+    max_msg_len = 600
+    assert len(msg) < max_msg_len
+    # the full command is still available
+    assert ce.cmd == cmd
+    ce_repr = repr(ce)
+    assert ce_repr == f'CommandError({cmd!r}, returncode=1)'
+    # the cached command representation is reused for repeated calls
+    assert repr(ce) == ce_repr
+    # a replaced command is reflected in the representation
+    ce.cmd = ['git', 'status']
+    assert repr(ce) != ce_repr
+    assert repr(ce) == "CommandError(['git', 'status'], returncode=1)"
+
+
+def test_CommandError_pathlike_cwd() -> None:
+    ce = CommandError('mycmd', returncode=1, cwd=PurePosixPath('/some/where'))
+    assert (
+        str(ce) == "Command 'mycmd' returned non-zero exit status 1 at CWD /some/where"
+    )
+
+
 def check_reraise_CommandError_with_msg():
     try:
         # some call raises an original exception
@@ -104,9 +154,45 @@ def check_reraise_CommandError_with_msg():
 def test_CommandError_context_msg():
     with pytest.raises(CommandError) as cmderr:
         check_reraise_CommandError_with_msg()
+    assert str(cmderr.value) is str(cmderr.value)
+    # a changed message is reflected, even after the exception was rendered
+    cmderr.value.msg = 'other hint'
+    assert str(cmderr.value).endswith('[other hint]')
+    cmderr.value.msg = 'context info or hint'
     assert cmderr.value.cmd == 'mycmd'
     assert cmderr.value.msg == 'context info or hint'
     assert (
         str(cmderr.value) == "Command 'mycmd' errored with unknown exit status "
         '[context info or hint]'
     )
+
+
+def test_CommandError_slots() -> None:
+    ce = CommandError(['mycmd'], msg='hint', returncode=1, stderr=b'err')
+    str(ce)
+    repr(ce)
+    # all attributes, including the rendering caches, live in slots
+    assert not ce.__dict__
+
+
+def test_CommandError_pickle():
+    orig = CommandError(
+        ['mycmd', 'arg'],
+        msg='hint',
+        returncode=3,
+        stdout='out',
+        stderr=b'err',
+        cwd='/some/where',
+    )
+    restored = pickle.loads(pickle.dumps(orig))  # noqa: S301
+    assert type(restored) is CommandError
+    assert repr(restored) == repr(orig)
+    assert str(restored) == str(orig)
+    assert restored.args == orig.args
+
+
+def test_CommandError_args():
+    # like for any RuntimeError, the message is the only argument
+    assert CommandError('mycmd').args == ('',)
+    assert CommandError(['mycmd'], '', 2).args == ('',)
+    assert CommandError(['mycmd'], msg='hint').args == ('hint',)
@@ -1,4 +1,5 @@
 import sys
+from subprocess import DEVNULL
 
 import pytest
 
@@ -30,3 +31,18 @@ def test_iter_subproc_cwd(tmp_path):
     with iter_subproc([sys.executable, '-c', check_fx], cwd=tmp_path) as proc:
         out = b''.join(proc)
         assert b'okidoki' in out
+
+
+def test_iter_subproc_devnull():
+    exitcode = 3
+    with pytest.raises(CommandError) as e:  # noqa PT012
+        with iter_subproc(
+            [
+                sys.executable,
+                '-c',
+                f'print("x" * 1000000); raise SystemExit({exitcode})',
+            ],
+            stdout=DEVNULL,
+        ) as proc:
+            assert list(proc) == []
+    assert e.value.returncode == exitcode
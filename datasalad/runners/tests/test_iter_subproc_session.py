@@ -0,0 +1,37 @@
+import sys
+
+import pytest
+
+from .. import (
+    CommandError,
+    iter_subproc_session,
+)
+
+
+def test_iter_subproc_session():
+    with iter_subproc_session(['cat']) as session:
+        for i in range(100):
+            assert session.run(f'request {i}\n'.encode()) == f'request {i}'.encode()
+    assert session.returncode == 0
+
+    # custom response separator
+    with iter_subproc_session(['cat'], sep=b'\0') as session:
+        assert session.run(b'one\0') == b'one'
+
+
+def test_iter_subproc_session_no_response():
+    exit_code = 3
+    with pytest.raises(CommandError) as e, iter_subproc_session(
+        [sys.executable, '-c', f'import sys; sys.exit({exit_code})'],
+    ) as session, pytest.raises(EOFError):
+        session.run(b'request\n')
+    assert e.value.returncode == exit_code
+
+
+def test_iter_subproc_session_exception_in_context():
+    with pytest.raises(ValueError, match='mine'), iter_subproc_session(  # noqa: PT012
+        ['cat']
+    ) as session:
+        session.run(b'one\n')
+        msg = 'mine'
+        raise ValueError(msg)
@@ -69,7 +69,7 @@ Setting keys need not be of type ``str``, but can be any hashable type,
 and need not necessarily be homogeneous across (or even within) individual
 sources, as long as their are hashable
 
->>> defaults[(0, 1, 2)] = Settings(object)
+>>> defaults[(0, 1, 2)] = Setting(object)
 
 There is support for multiple values registered under a single key, even within
 a single source. The standard accessor methods (:meth:`__getitem__`, and
@@ -46,7 +46,8 @@ class Defaults(InMemory):
     """
 
     def _set_item(self, key: Hashable, value: Setting) -> None:
-        if key in self:
+        # probe the cache directly, instead of going through `__contains__()`
+        if key in self._items:
             # resetting is something that is an unusual event.
             # __setitem__ does not allow for a dedicated "force" flag,
             # so we leave a message at least
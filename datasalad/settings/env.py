@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from os import (
     environ,
 )
@@ -20,6 +21,10 @@ if TYPE_CHECKING:
 
 lgr = logging.getLogger('datasalad.settings')
 
+# on these platforms, Python treats environment variable names as
+# case-insensitive, and converts them to upper case
+_uppercase_varnames = os_name in ('os2', 'nt')
+
 
 class Environment(WritableSource):
     """Process environment source
@@ -55,9 +60,15 @@ class Environment(WritableSource):
         super().__init__()
         self._var_prefix = (
             var_prefix.upper()
-            if var_prefix is not None and os_name in ('os2', 'nt')
+            if var_prefix is not None and _uppercase_varnames
             else var_prefix
         )
+        # the prefix that variable names are tested against, see
+        # `include_var()`
+        self._name_prefix = self._var_prefix or ''
+        # validated variable names for keys, see `get_varname_from_key()`.
+        # only `str` keys are stored, but any key can be looked up
+        self._varnames: dict[Hashable, str] = {}
 
     def _reinit(self):
         """Does nothing"""
@@ -89,23 +100,28 @@ class Environment(WritableSource):
            uppercase keys with the default implementation. Reimplement
            :meth:`get_key_from_varname()` to modify this behavior.
         """
-        varmap = {
-            k: self.get_key_from_varname(k)
-            for k, v in environ.items()
-            if self.include_var(name=k, value=v)
+        if type(self).include_var is Environment.include_var:
+            # the default filter only needs the name, and no method call.
+            # the names are taken from a snapshot. Materializing them in
+            # one go is cheaper than iterating the `environ` mapping, and
+            # is not affected by concurrent modifications
+            prefix = self._name_prefix
+            names = [k for k in list(environ) if k.startswith(prefix)]
+        else:
+            names = [k for k, v in environ.items() if self.include_var(name=k, value=v)]
+        # group variable names by the key they map to
+        varnames: defaultdict[Hashable, list[str]] = defaultdict(list)
+        for k in names:
+            varnames[self.get_key_from_varname(k)].append(k)
+        ambiguous = {
+            key: sorted(names) for key, names in varnames.items() if len(names) > 1
         }
-        _keys = set(varmap.values())
-        if len(_keys) < len(varmap):
-            allkeys = list(varmap.values())
+        if ambiguous:
             lgr.warning(
                 'Ambiguous ENV variables map on identical keys: %r',
-                {
-                    key: [k for k in sorted(varmap) if varmap[k] == key]
-                    for key in _keys
-                    if allkeys.count(key) > 1
-                },
+                ambiguous,
             )
-        return _keys
+        return set(varnames)
 
     def __str__(self):
         return f'Environment[{self._var_prefix}]' if self._var_prefix else 'Environment'
@@ -132,7 +148,7 @@ class Environment(WritableSource):
 
         Reimplement this method to perform custom tests.
         """
-        return name.startswith(self._var_prefix or '')
+        return name.startswith(self._name_prefix)
 
     def get_key_from_varname(self, name: str) -> Hashable:
         """Transform an environment variable name to a setting key
@@ -157,11 +173,24 @@ class Environment(WritableSource):
            upper case, and are effectively treated as case-insensitive,
            on that platform.
         """
+        # the same keys tend to be queried over and over again. The mapping
+        # does not change, no need to validate a key more than once
+        varname = self._varnames.get(key)
+        if varname is not None:
+            return varname
+        varname = self._make_varname(key)
+        if type(key) is str:
+            # only cache `str` keys. Keys of other types can compare equal,
+            # but have different string representations (e.g., 1 and True)
+            self._varnames[key] = varname
+        return varname
+
+    def _make_varname(self, key: Hashable) -> str:
         varname = str(key)
         if '=' in varname or '\0' in varname:
             msg = "illegal environment variable name (contains '=' or NUL)"
             raise ValueError(msg)
-        if os_name in ('os2', 'nt'):
+        if _uppercase_varnames:
             # https://stackoverflow.com/questions/19023238/why-python-uppercases-all-environment-variables-in-windows
             return varname.upper()
         return varname
@@ -1,18 +1,64 @@
 from __future__ import annotations
 
-from copy import copy
 from typing import (
     Any,
     Callable,
 )
+from weakref import WeakKeyDictionary
 
 
 class UnsetValue:
     """Placeholder type to indicate a value that has not been set"""
 
+    # the class itself is the placeholder, it is never instantiated
+    __slots__ = ()
+
+
+# marker for a coerced value that has not been computed yet
+_uncoerced = object()
+
+# slot names of derived `Setting` classes, see `_get_slotnames()`
+_slotnames: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
+
+
+def _get_slotnames(cls: type) -> tuple[str, ...]:
+    # all slots declared by a class and its bases, with private names
+    # mangled, like `copyreg._slotnames()` does it for the standard
+    # `copy()` protocol
+    names = _slotnames.get(cls)
+    if names is not None:
+        return names
+    collected = []
+    for c in cls.__mro__:
+        slots = c.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        # the prefix of mangled private names. A class name made of
+        # underscores only does not mangle
+        stripped = c.__name__.lstrip('_')
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if stripped and name.startswith('__') and not name.endswith('__'):
+                collected.append(f'_{stripped}{name}')
+            else:
+                collected.append(name)
+    names = _slotnames[cls] = tuple(collected)
+    return names
+
 
 class Setting:
-    """Representation of an individual setting"""
+    """Representation of an individual setting
+
+    Instances have no ``__dict__``, their attributes are declared via
+    ``__slots__``. A derived class without its own ``__slots__`` declaration
+    can still set any attributes. Derived classes that may be instantiated in
+    large numbers should declare ``__slots__`` for any additional attributes.
+    :meth:`copy` preserves additional attributes either way.
+    """
+
+    # there can be many settings, and many (flattened) copies of them
+    __slots__ = ('_coerced', '_coercer', '_lazy', '_value')
 
     def __init__(
         self,
@@ -32,6 +78,11 @@ class Setting:
         If ``lazy`` is ``True``, ``value`` must be a callable that requires
         no parameters. This callable will be executed each time :attr:`value`
         is accessed, and its return value is passed to the ``coercer``.
+        Otherwise, the ``coercer`` only runs on first access, and its return
+        value is reused for any subsequent access. This means that every
+        access returns the very same object. If a ``coercer`` returns a
+        mutable object (e.g., a ``list`` or ``dict``), any modification of
+        it is visible to later reads of :attr:`value`.
         """
         if lazy and not callable(value):
             msg = 'callable required for lazy evaluation'
@@ -39,6 +90,7 @@ class Setting:
         self._value = value
         self._coercer = coercer
         self._lazy = lazy
+        self._coerced = _uncoerced
 
     @property
     def pristine_value(self) -> Any:
@@ -50,15 +102,28 @@ class Setting:
         """Value of a setting after coercion
 
         For a lazy setting, accessing this property also triggers the
-        evaluation.
+        evaluation. For any other setting, the coerced value is computed
+        once, and the same object is returned on every access. A mutable
+        coercer result is therefore shared between all reads.
         """
-        # we ignore the type error here
-        # "error: "UnsetValue" not callable"
-        # because we rule this out in the constructor
-        val = self._value() if self._lazy else self._value  # type: ignore [operator]
-        if self._coercer:
-            return self._coercer(val)
-        return val
+        # the value of a non-lazy setting does not change, until it is
+        # updated. There is no need to coerce it more than once.
+        # a cached value is only ever set for such a setting, and is
+        # reported without looking at any other property
+        coerced = self._coerced
+        if coerced is not _uncoerced:
+            return coerced
+        coercer = self._coercer
+        if self._lazy:
+            # we ignore the type error here
+            # "error: "UnsetValue" not callable"
+            # because we rule this out in the constructor
+            val = self._value()  # type: ignore [operator]
+            return coercer(val) if coercer else val
+        if not coercer:
+            return self._value
+        coerced = self._coerced = coercer(self._value)
+        return coerced
 
     @property
     def coercer(self) -> Callable | None:
@@ -89,6 +154,9 @@ class Setting:
         if other._coercer:  # noqa: SLF001
             self._coercer = other._coercer  # noqa: SLF001
 
+        # any previously coerced value is outdated
+        self._coerced = _uncoerced
+
     def __str__(self) -> str:
         # wrap the value in the classname to make clear that
         # the actual object type is different from the value
@@ -116,9 +184,37 @@ class Setting:
         return (
             self._lazy == item._lazy
             and self._value == item._value
-            and self._coercer == item._coercer
+            # coercers are typically shared, identical objects.
+            # an identity test is cheaper than a comparison
+            and (self._coercer is item._coercer or self._coercer == item._coercer)
         )
 
+    def __copy__(self):
+        # shortcut the generic `copy()` protocol (via `__reduce_ex__()`).
+        # Settings are copied whenever they are flattened across sources
+        cls = self.__class__
+        new: Setting = cls.__new__(cls)
+        if cls is Setting:
+            # `__init__()` sets all slots
+            new._value = self._value
+            new._coercer = self._coercer
+            new._lazy = self._lazy
+            new._coerced = self._coerced
+            return new
+        # a derived class can declare additional slots, and need not
+        # initialize all of them
+        for name in _get_slotnames(cls):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            setattr(new, name, value)
+        # derived classes can also have additional attributes in a `__dict__`
+        attrs = getattr(self, '__dict__', None)
+        if attrs:
+            new.__dict__.update(attrs)
+        return new
+
     def copy(self):
         """Return a shallow copy of the instance"""
-        return copy(self)
+        return self.__copy__()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from copy import copy
-from itertools import chain
 from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
@@ -50,8 +49,23 @@ class Settings:
     ):
         # we keep the sources strictly separate.
         # the order here matters and represents the
-        # precedence rule
-        self._sources = sources
+        # precedence rule.
+        # the set of sources is fixed at construction (`sources` is a
+        # read-only view). A private copy makes sure that the mapping and the
+        # source sequence below cannot get out of sync
+        self._sources = dict(sources)
+        # a view on the private copy needs to be created only once
+        self._sources_view = MappingProxyType(self._sources)
+        # iterating a tuple is cheaper than a new dict view for each query
+        self._source_seq = tuple(self._sources.values())
+        # lookups that flatten settings across sources start with the
+        # lowest precedence
+        self._source_seq_rev = self._source_seq[::-1]
+        # whether a source supports multi-value reporting is fixed, too.
+        # `getall()` need not probe for it on every query
+        self._source_has_getall = tuple(
+            hasattr(s, 'getall') for s in self._source_seq_rev
+        )
 
     @property
     def sources(self) -> MappingProxyType:
@@ -60,11 +74,19 @@ class Settings:
         This property is used to select individual sources for source-specific
         operations, such as writing a setting to an underlying source.
         """
-        return MappingProxyType(self._sources)
+        return self._sources_view
 
     def __len__(self):
         return len(self.keys())
 
+    def __bool__(self):
+        # a truth test need not count the union of all keys. It is enough
+        # to find a single source with any key
+        for s in self._source_seq:  # noqa: SIM110
+            if s.keys():
+                return True
+        return False
+
     def __getitem__(self, key: Hashable) -> Setting:
         """Some"""
         # this will become the return item
@@ -74,16 +96,16 @@ class Settings:
         # - update a copy of this particular instance with all information
         #   from sources with higher priority and flatten it across
         #   sources
-        for s in reversed(self._sources.values()):
-            update_item = None
+        for s in self._source_seq_rev:
             try:
                 update_item = s[key]
             except KeyError:
                 # source does not have it, proceed
                 continue
             if item is None:
-                # in-place modification and destroy the original
-                # item's integrity
+                # always report a copy, even if no other source has this
+                # key. In-place modification of the returned item would
+                # otherwise destroy the original item's integrity
                 item = copy(update_item)
                 continue
             # we run the update() method of the first item we ever found.
@@ -97,11 +119,18 @@ class Settings:
         return item
 
     def __contains__(self, key: Hashable):
-        return any(key in s for s in self._sources.values())
+        # explicit loop, `any()` would need a generator
+        for s in self._source_seq:  # noqa: SIM110
+            if key in s:
+                return True
+        return False
 
     def keys(self) -> set[Hashable]:
         """Returns all setting keys known across all sources"""
-        return set(chain.from_iterable(s.keys() for s in self._sources.values()))
+        keys: set[Hashable] = set()
+        for s in self._source_seq:
+            keys.update(s.keys())
+        return keys
 
     def get(self, key: Hashable, default: Any = None) -> Setting:
         """Return a particular setting identified by its key, or a default
@@ -130,16 +159,15 @@ class Settings:
         ``default`` value is returned.
         """
         # no flattening, get all from all
-        items: tuple[Setting, ...] = ()
-        for s in reversed(self._sources.values()):
+        items: list[Setting] = []
+        for s, has_getall in zip(self._source_seq_rev, self._source_has_getall):
             if key in s:
                 # we checked before, no need to handle a default here
-                items = (
-                    (*items, *s.getall(key))
-                    if hasattr(s, 'getall')
-                    else (*items, s[key])
-                )
-        return items if items else (self._get_default_setting(default),)
+                if has_getall:
+                    items.extend(s.getall(key))
+                else:
+                    items.append(s[key])
+        return tuple(items) if items else (self._get_default_setting(default),)
 
     def _get_default_setting(self, default: Any) -> Setting:
         if isinstance(default, Setting):
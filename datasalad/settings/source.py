@@ -7,8 +7,8 @@ from abc import (
 from typing import (
     TYPE_CHECKING,
     Any,
-    Generator,
     Hashable,
+    Iterator,
 )
 
 from datasalad.settings.setting import Setting
@@ -102,15 +102,16 @@ class Source(ABC):
     def get(self, key: Hashable, default: Any = None) -> Setting:
         """Return a particular setting identified by its key, or a default
 
-        This method calls ``__getitem__``, and returns the default on
-        a ``KeyError`` exception.
+        This method calls ``_get_item()`` (like ``__getitem__``), and returns
+        the default on a ``KeyError`` exception.
 
         When the ``default`` value is not given as an instance of
         :class:`~datasalad.settings.Setting`, it will be
         automatically wrapped into the one given by :attr:`Source.item_type`.
         """
         try:
-            return self[key]
+            # `__getitem__()` only calls `_get_item()`, save the detour
+            return self._get_item(key)
         except KeyError:
             return self._get_default_setting(default)
 
@@ -134,14 +135,18 @@ class Source(ABC):
         """
         return (self[key],)
 
+    # the following methods query `_get_keys()` directly, `keys()` is merely
+    # the public interface to it
+
     def __len__(self) -> int:
-        return len(self.keys())
+        return len(self._get_keys())
 
     def __contains__(self, key: Hashable) -> bool:
-        return key in self.keys()
+        return key in self._get_keys()
 
-    def __iter__(self) -> Generator[Hashable]:
-        yield from self.keys()
+    def __iter__(self) -> Iterator[Hashable]:
+        # a plain iterator, no generator needs to be resumed for each key
+        return iter(self._get_keys())
 
     def _get_default_setting(self, default: Any) -> Setting:
         if isinstance(default, Setting):
@@ -260,11 +265,14 @@ class CachingSource(WritableMultivalueSource):
 
     @property
     def _items(self) -> dict[Hashable, Setting | tuple[Setting, ...]]:
-        if self.__items is None:
+        items = self.__items
+        if items is None:
+            # first access, populate the cache
             self.reinit().load()
-        if TYPE_CHECKING:
-            assert self.__items is not None
-        return self.__items
+            items = self.__items
+            if TYPE_CHECKING:
+                assert items is not None
+        return items
 
     def _reinit(self) -> None:
         # particular implementations may not use this facility,
@@ -290,9 +298,25 @@ class CachingSource(WritableMultivalueSource):
     def __contains__(self, key: Hashable) -> bool:
         return key in self._items
 
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+
     def _get_keys(self) -> Collection[Hashable]:
         return self._items.keys()
 
+    def _add(self, key: Hashable, value: Setting) -> None:
+        # like the base class implementation, but with a single cache
+        # lookup instead of a membership test and a `getall()` call.
+        # writing still goes through `__setitem__()` and `setall()`, which
+        # subclasses reimplement to update the actual source
+        existing = self._items.get(key)
+        if existing is None:
+            self[key] = value
+        elif isinstance(existing, tuple):
+            self.setall(key, (*existing, value))
+        else:
+            self.setall(key, (existing, value))
+
     def _setall(self, key: Hashable, values: tuple[Setting, ...]) -> None:
         self._items[key] = values
 
@@ -300,21 +324,19 @@ class CachingSource(WritableMultivalueSource):
         return f'{self.__class__.__name__}({self._items!r})'
 
     def __str__(self) -> str:
-        return ''.join(
-            (
-                f'{self.__class__.__name__}(',
-                ','.join(
-                    # we use the pristine value here to avoid issues
-                    # with validation/coercion failures when rendering
-                    # sources
-                    f'{k}=({",".join(repr(val.pristine_value) for val in v)})'
-                    if isinstance(v, tuple)
-                    else f'{k}={v.pristine_value!r}'
-                    for k, v in self._items.items()
-                ),
-                ')',
-            )
+        # we use the pristine value here to avoid issues
+        # with validation/coercion failures when rendering
+        # sources.
+        # `join()` needs a sequence, and would first turn a generator into one
+        items = ','.join(
+            [
+                f'{k}=({",".join([repr(val.pristine_value) for val in v])})'
+                if isinstance(v, tuple)
+                else f'{k}={v.pristine_value!r}'
+                for k, v in self._items.items()
+            ]
         )
+        return f'{self.__class__.__name__}({items})'
 
     def _getall(self, key: Hashable) -> tuple[Setting, ...]:
         # ok to let KeyError bubble up
@@ -140,3 +140,13 @@ def test_envsrc_lowercase_keys():
             env.keys() == {'MYAPP_CONF'} if os_name in ('os2', 'nt') else {'myapp_conf'}
         )
         assert env['myapp_conf'].value == '123'
+
+
+def test_envsrc_custom_include_var():
+    class ValueFilterEnvironment(Environment):
+        def include_var(self, name: str, value: str) -> bool:
+            return name.startswith('MYAPP_') and value != 'skip'
+
+    with patch.dict(environ, {'MYAPP_ONE': 'keep', 'MYAPP_TWO': 'skip'}):
+        assert ValueFilterEnvironment().keys() == {'MYAPP_ONE'}
+        assert Environment(var_prefix='MYAPP_').keys() == {'MYAPP_ONE', 'MYAPP_TWO'}
@@ -1,3 +1,5 @@
+from copy import copy
+
 import pytest
 
 from ..setting import Setting
@@ -35,3 +37,68 @@ def test_setting_derived_copy():
 
     # __eq__ considers the derived type and rejects
     assert ms != Setting(target)
+
+
+def test_setting_derived_slots_copy():
+    class SlottedSetting(Setting):
+        __slots__ = ('__private', 'extra', 'unset')
+
+        def __init__(self, value, extra: str):
+            super().__init__(value)
+            self.extra = extra
+            self.__private = extra
+
+        @property
+        def private(self):
+            return self.__private
+
+    target = 'dummy'
+    ss = SlottedSetting(target, 'more')
+    ss_c = ss.copy()
+    assert ss_c is not ss
+    assert ss_c == ss
+    assert ss_c.extra == ss_c.private == 'more'
+    # slots that were never set remain unset
+    assert not hasattr(ss_c, 'unset')
+
+    class PartialSetting(Setting):
+        def __init__(self):
+            # set only some of the base class slots
+            self._value = 'partial'
+
+    ps_c = PartialSetting().copy()
+    assert ps_c.pristine_value == 'partial'
+    assert not hasattr(ps_c, '_coercer')
+
+
+def test_setting_copy():
+    orig_val = 5
+    item = Setting(str(orig_val), coercer=int)
+    item_c = copy(item)
+    assert type(item_c) is Setting
+    assert item_c is not item
+    assert item_c == item
+    # the copy is independent
+    item_c.update(Setting(str(orig_val + 1)))
+    assert item.value == orig_val
+    assert item_c.value == orig_val + 1
+
+
+def test_setting_coerce_once():
+    calls = []
+
+    def coercer(val):
+        calls.append(val)
+        return int(val)
+
+    item = Setting('5', coercer=coercer)
+    assert item.value == item.value == int('5')
+    assert calls == ['5']
+    # an update invalidates the coerced value
+    item.update(Setting('6'))
+    assert item.value == int('6')
+    assert calls == ['5', '6']
+    # lazy settings are coerced on each access
+    item = Setting(lambda: '7', coercer=coercer, lazy=True)
+    assert item.value == item.value == int('7')
+    assert calls == ['5', '6', '7', '7']
@@ -19,6 +19,7 @@ def test_settings():
 
     assert list(man.sources.keys()) == ['mem1', 'mem2', 'defaults']
     assert len(man) == 0
+    assert not man
     target_key = 'some.key'
     assert target_key not in man
     with pytest.raises(KeyError):
@@ -26,6 +27,7 @@ def test_settings():
 
     man.sources['defaults'][target_key] = Setting('0', coercer=int)
     assert man[target_key].value == 0
+    assert man
 
     man.sources['mem2'][target_key] = Setting('1', coercer=float)
     man.sources['mem1'][target_key] = Setting('2')
@@ -64,3 +66,19 @@ def test_settings():
         ).value
         is sys.executable
     )
+
+
+def test_settings_flattening_copies():
+    defaults = Defaults()
+    man = Settings({'mem': InMemory(), 'defaults': defaults})
+    defaults['some.key'] = Setting('0', coercer=int)
+    # a setting from a single source is reported as a copy too
+    item = man['some.key']
+    assert item is not defaults['some.key']
+    item.update(Setting('5'))
+    assert defaults['some.key'].value == 0
+    # flattening across sources leaves the original settings untouched
+    man.sources['mem']['some.key'] = Setting('1')
+    assert man['some.key'].value == 1
+    assert defaults['some.key'].value == 0
+    assert man.sources['mem']['some.key'].coercer is None
@@ -46,6 +46,36 @@ def test_cachingsource():
     assert ds['notherebefore'].value == 'butnow'
 
 
+def test_cachingsource_load_once():
+    class CountingSource(CachingSource):
+        loads = 0
+
+        def _load(self):
+            self.loads += 1
+            self['preloaded'] = Setting('yes')
+
+    src = CountingSource()
+    assert not src.loads
+    assert src['preloaded'].value == 'yes'
+    assert 'preloaded' in src
+    assert len(src) == 1
+    assert src.loads == 1
+    with pytest.raises(AttributeError):
+        src.idonotexist  # noqa: B018
+
+
+def test_cachingsource_subclass_attributeerror():
+    class BrokenPropertySource(DummyCachingSource):
+        @property
+        def broken(self):
+            return self.idonotexist
+
+    src = BrokenPropertySource()
+    # the original error is reported, not one for the property itself
+    with pytest.raises(AttributeError, match='idonotexist'):
+        src.broken  # noqa: B018
+
+
 def test_settings_base_default_methods():
     class DummySource(Source):
         def _load(self):  # pragma: no cover